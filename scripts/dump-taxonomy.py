@@ -1,3 +1,5 @@
+import sys
+
 import mireport
 from mireport.taxonomy import VSME_ENTRY_POINT, getTaxonomy, listTaxonomies
 
@@ -8,15 +10,15 @@ def main() -> None:
     print(f"Ready to show {VSME_ENTRY_POINT} ")
     input("Press Enter to continue...")
     vsme = getTaxonomy(VSME_ENTRY_POINT)
+    tabs = ["\t" * depth for depth in range(32)]
+    lines = []
     for group in vsme.presentation:
-        print(f"{group.label} [{group.roleUri}]")
-        for relationship in group.relationships:
-            concept = relationship.concept
-            print(
-                "\t" * relationship.depth,
-                concept.getStandardLabel(),
-                f"[{concept.qname} {concept.dataType}]",
-            )
+        lines.append(f"{group.label} [{group.roleUri}]")
+        for depth, label, concept in group.iterLabels():
+            indent = tabs[depth] if depth < len(tabs) else "\t" * depth
+            lines.append(f"{indent} {label} [{concept.qname} {concept.dataType}]")
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,31 @@
+import argparse
+import logging
+from pathlib import Path
+
+from mireport.arelle.daemon import getSocketPath, serve
+
+
+def parse_args() -> argparse.Namespace:
+    argparser = argparse.ArgumentParser(
+        description="Keep Arelle loaded in the background so that check-report.py runs start quickly."
+    )
+    argparser.add_argument(
+        "--socket",
+        type=Path,
+        default=getSocketPath(),
+        help=f"Path of the unix socket to listen on. Default: {getSocketPath()}",
+    )
+    return argparser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO)
+    try:
+        serve(args.socket)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
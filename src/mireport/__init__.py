@@ -1,21 +1,163 @@
+import hashlib
 import logging
+import os
+import pickle
+import stat
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from importlib.abc import Traversable
+from importlib.resources import files
+from pathlib import Path
+from typing import Callable, Optional
 
 from mireport.data import excel_templates, taxonomies
-from mireport.excelprocessor import _loadVsmeDefaults
-from mireport.json import getJsonFiles, getObject, getResource
-from mireport.taxonomy import _loadTaxonomyFromFile
+from mireport.json import getCachedObject, getJsonFiles, getResource
+from mireport.taxonomy import (
+    Taxonomy,
+    _buildTaxonomy,
+    _clearTaxonomies,
+    _registerTaxonomy,
+)
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 __all__ = ["loadMetaData"]
 
+_LOADED = False
 
-def loadMetaData() -> None:
-    """Loads the taxonomies, unit registry and other models."""
-    for f in getJsonFiles(taxonomies):
+DISABLE_TAXONOMY_CACHE_ENV = "MIREPORT_DISABLE_TAXONOMY_CACHE"
+
+# Modules defining the classes that end up in a pickled taxonomy. Their source
+# is part of the cache key so a code change never unpickles a stale layout.
+#
+# Caching the *built* model is what pays off, but only modestly: parsing and
+# building vsme.json takes ~45-65ms whereas hashing the inputs (~3-4ms) and
+# unpickling (~30-35ms) takes ~35ms, so a warm cache saves ~30ms per process.
+# Shipping the JSON as a generated Python module doesn't help as importing it
+# rebuilds the dict displays with bytecode rather than unmarshalling them. A
+# msgpack sidecar decodes no faster than orjson (~5ms either way) so that isn't
+# worth a second on-disk format either.
+#
+# The cache is unpickled from the user's cache directory so, as pickle.loads()
+# runs arbitrary code, files that another user could have written are ignored
+# (see _isTrustedCacheFile).
+_PICKLED_MODULE_SOURCES = ("taxonomy.py", "utr.py", "xml.py")
+
+# The packaged taxonomies don't change while we're running so only list them once.
+_TAXONOMY_JSON_FILES: tuple[Traversable, ...] = tuple(
+    sorted(getJsonFiles(taxonomies), key=lambda f: f.name)
+)
+
+
+def loadMetaData(force: bool = False) -> None:
+    """Loads the taxonomies, unit registry and other models.
+
+    Subsequent calls are no-ops unless force is True, in which case the
+    in-memory registries are rebuilt (from the already parsed JSON)."""
+    global _LOADED
+    if _LOADED and not force:
+        return
+    # Imported here so that "import mireport.cli" etc stay light.
+    from mireport.excelprocessor import _loadVsmeDefaults
+
+    if force:
+        _clearTaxonomies()
+
+    useCache = os.environ.get(DISABLE_TAXONOMY_CACHE_ENV, "") in ("", "0")
+    toBuild: list[tuple[Traversable, Optional[Path]]] = []
+    for f in _TAXONOMY_JSON_FILES:
         try:
-            _loadTaxonomyFromFile(getObject(f))
+            cachePath = _getTaxonomyCachePath(f) if useCache else None
+            if cachePath is not None and (cached := _loadCachedTaxonomy(cachePath)):
+                _registerTaxonomy(cached)
+            else:
+                toBuild.append((f, cachePath))
         except Exception as e:
             logging.error(f"Error loading taxonomy from {f.name}", exc_info=e)
 
-    _loadVsmeDefaults(getObject(getResource(excel_templates, "vsme.json")))
+    if len(toBuild) > 1:
+        # Building is CPU bound and independent per file so use all the cores.
+        workers = min(os.cpu_count() or 1, len(toBuild))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (f, cachePath, executor.submit(_buildTaxonomyFromResource, f.name))
+                for f, cachePath in toBuild
+            ]
+            for f, cachePath, future in futures:
+                _registerBuiltTaxonomy(f, cachePath, future.result)
+    else:
+        for f, cachePath in toBuild:
+            _registerBuiltTaxonomy(
+                f, cachePath, partial(_buildTaxonomyFromResource, f.name)
+            )
+
+    _loadVsmeDefaults(getCachedObject(excel_templates, "vsme.json"))
+    _LOADED = True
+
+
+def _getCacheDir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "mireport"
+
+
+def _getTaxonomyCachePath(source: Traversable) -> Path:
+    digest = hashlib.blake2b(source.read_bytes(), digest_size=16)
+    digest.update(getResource("mireport.data", "utr.json").read_bytes())
+    for name in _PICKLED_MODULE_SOURCES:
+        digest.update(files(__name__).joinpath(name).read_bytes())
+    stem = source.name.removesuffix(".json")
+    return _getCacheDir() / f"{stem}-{digest.hexdigest()}.pkl"
+
+
+def _isTrustedCacheFile(st: os.stat_result) -> bool:
+    """Only our own files that nobody else can write to are safe to unpickle."""
+    if not hasattr(os, "getuid"):
+        # Windows: the cache lives in the user's own profile.
+        return True
+    return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _loadCachedTaxonomy(cachePath: Path) -> Optional[Taxonomy]:
+    try:
+        with open(cachePath, "rb") as f:
+            if not _isTrustedCacheFile(os.fstat(f.fileno())):
+                logging.warning(
+                    f"Ignoring taxonomy cache {cachePath} as it isn't private to this user"
+                )
+                return None
+            return pickle.loads(f.read())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logging.warning(f"Ignoring unusable taxonomy cache {cachePath}", exc_info=e)
+    return None
+
+
+def _saveCachedTaxonomy(cachePath: Path, taxonomy: Taxonomy) -> None:
+    try:
+        cachePath.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmpPath = cachePath.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(tmpPath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "wb") as f:
+            f.write(pickle.dumps(taxonomy, protocol=5))
+        tmpPath.replace(cachePath)
+    except OSError as e:
+        logging.debug(f"Unable to write taxonomy cache {cachePath}", exc_info=e)
+
+
+def _buildTaxonomyFromResource(name: str) -> Taxonomy:
+    """Picklable entry point so taxonomies can be built in worker processes."""
+    return _buildTaxonomy(getCachedObject(taxonomies, name))
+
+
+def _registerBuiltTaxonomy(
+    source: Traversable, cachePath: Optional[Path], build: Callable[[], Taxonomy]
+) -> None:
+    try:
+        taxonomy = build()
+        _registerTaxonomy(taxonomy)
+    except Exception as e:
+        logging.error(f"Error loading taxonomy from {source.name}", exc_info=e)
+        return
+    if cachePath is not None:
+        _saveCachedTaxonomy(cachePath, taxonomy)
@@ -0,0 +1,209 @@
+"""
+A long-lived local server that keeps Arelle imported between command line
+invocations (see scripts/mireport-daemon.py) so that check-report skips the
+interpreter start-up and Arelle import time. Each request is still validated
+by a fresh Arelle Session. The protocol is a single JSON request line answered
+by a single JSON response line per connection.
+
+The socket lives in a directory only the user can access and both ends check
+that the other is running as the same user, so nobody else can answer (or
+send) requests.
+
+The client side deliberately avoids importing Arelle.
+"""
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import struct
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+from mireport.conversionresults import Message
+from mireport.exceptions import MIReportException
+
+L = logging.getLogger(__name__)
+
+SOCKET_NAME = "mireport.sock"
+
+# Unix domain sockets are missing on some platforms (e.g. Windows) and there
+# is no daemon there: everything runs in-process.
+DAEMON_SUPPORTED = hasattr(socket, "AF_UNIX")
+
+
+class DaemonResult(NamedTuple):
+    messages: Sequence[Message]
+    logLines: Sequence[str]
+
+
+def getSocketPath() -> Path:
+    """$XDG_RUNTIME_DIR is already private to the user. The temp directory is
+    shared so use a per-user directory inside it."""
+    if runtimeDir := os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(runtimeDir, SOCKET_NAME)
+    return Path(tempfile.gettempdir(), f"mireport-{os.getuid()}", SOCKET_NAME)
+
+
+def _isOurs(st: os.stat_result) -> bool:
+    return st.st_uid == os.getuid()
+
+
+def _isPrivateDirectory(path: Path) -> bool:
+    try:
+        st = path.lstat()
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode) and _isOurs(st) and not st.st_mode & 0o077
+
+
+def _getPeerUid(sock: socket.socket) -> Optional[int]:
+    """The uid of the process at the other end of a connected unix socket, or
+    None where the platform doesn't say."""
+    if (peerCred := getattr(socket, "SO_PEERCRED", None)) is not None:
+        # Linux: struct ucred {pid_t pid; uid_t uid; gid_t gid;}
+        creds = sock.getsockopt(socket.SOL_SOCKET, peerCred, struct.calcsize("3i"))
+        return struct.unpack("3i", creds)[1]
+    if (localPeerCred := getattr(socket, "LOCAL_PEERCRED", None)) is not None:
+        # macOS/BSD: struct xucred {u_int cr_version; uid_t cr_uid; ...}
+        # at level SOL_LOCAL (0).
+        creds = sock.getsockopt(0, localPeerCred, struct.calcsize("2Ih16I"))
+        return struct.unpack_from("2I", creds)[1]
+    return None
+
+
+def _isPeerUs(sock: socket.socket) -> bool:
+    peerUid = _getPeerUid(sock)
+    return peerUid is None or peerUid == os.getuid()
+
+
+def requestFromDaemon(
+    request: dict[str, Any], socketPath: Optional[Path] = None
+) -> Optional[DaemonResult]:
+    """Send a request to a running daemon. Returns None if there isn't a usable
+    one (none running, not ours, or it went away before replying) so the
+    caller can do the work itself."""
+    if not DAEMON_SUPPORTED:
+        return None
+    if socketPath is None:
+        socketPath = getSocketPath()
+    try:
+        if not _isOurs(socketPath.stat()):
+            L.warning(f"Ignoring {socketPath} as it belongs to another user")
+            return None
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socketPath))
+            if not _isPeerUs(sock):
+                L.warning(f"Ignoring daemon at {socketPath} run by another user")
+                return None
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as responseStream:
+                response = json.loads(responseStream.readline())
+    except (OSError, ValueError) as e:
+        # ValueError covers a truncated or otherwise undecodable reply.
+        L.debug(f"No usable daemon at {socketPath}", exc_info=e)
+        return None
+    if (error := response.get("error")) is not None:
+        raise MIReportException(f"mireport daemon failed: {error}")
+    return DaemonResult(
+        messages=Message.fromDictList(response["m"]),
+        logLines=response["l"],
+    )
+
+
+if DAEMON_SUPPORTED:
+
+    class _RequestHandler(socketserver.StreamRequestHandler):
+        server: "ArelleDaemon"
+
+        def handle(self) -> None:
+            if not _isPeerUs(self.connection):
+                L.warning("Refusing a request from another user")
+                return
+            try:
+                response = self.server.process(json.loads(self.rfile.readline()))
+            except Exception as e:
+                L.exception("Failed to process request", exc_info=e)
+                response = {"error": str(e)}
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+    class ArelleDaemon(socketserver.ThreadingUnixStreamServer):
+        """Validates each request with a new ArelleReportProcessor; what the
+        daemon saves is having Python and Arelle already loaded."""
+
+        daemon_threads = True
+
+        def __init__(self, socketPath: Path):
+            # Create the socket owner-only from the start rather than chmod()ing
+            # it after bind(). Nothing else is running yet so the process wide
+            # umask change is safe.
+            oldUmask = os.umask(0o177)
+            try:
+                super().__init__(str(socketPath), _RequestHandler)
+            finally:
+                os.umask(oldUmask)
+
+        def process(self, request: dict[str, Any]) -> dict[str, Any]:
+            from mireport.arelle.report_info import (
+                ArelleReportProcessor,
+                getOrCreateReportPackage,
+            )
+
+            processor = ArelleReportProcessor(
+                taxonomyPackages=[Path(p) for p in request["taxonomyPackages"]],
+                workOffline=bool(request["workOffline"]),
+            )
+            source = getOrCreateReportPackage(Path(request["reportPath"]))
+            noCalcs = bool(request.get("disableCalculationValidation", False))
+            if (viewerPath := request.get("viewerPath")) is not None:
+                result = processor.validateAndGenerateViewer(
+                    source, disableCalculationValidation=noCalcs
+                )
+                Path(viewerPath).write_bytes(result.viewer.fileContent)
+            else:
+                result = processor.validateReportPackage(
+                    source, disableCalculationValidation=noCalcs
+                )
+            return {
+                "m": [m.toDict() for m in result.messages],
+                "l": list(result.logLines),
+            }
+
+
+def serve(socketPath: Optional[Path] = None) -> None:
+    if not DAEMON_SUPPORTED:
+        raise MIReportException("The mireport daemon needs unix domain sockets.")
+    if socketPath is None:
+        socketPath = getSocketPath()
+    socketDir = socketPath.parent
+    socketDir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if not _isPrivateDirectory(socketDir):
+        raise MIReportException(
+            f"Socket directory {socketDir} must be a directory owned by and only accessible to you."
+        )
+    if socketPath.exists():
+        if not _isOurs(socketPath.lstat()):
+            raise MIReportException(f"{socketPath} belongs to another user")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            try:
+                sock.connect(str(socketPath))
+                raise MIReportException(f"Daemon already listening on {socketPath}")
+            except ConnectionRefusedError:
+                # Left behind by a daemon that didn't shut down cleanly.
+                socketPath.unlink()
+    # Import Arelle up front; that is most of what the daemon saves.
+    import arelle.api.Session  # noqa: F401
+    import arelle.CntlrCmdLine  # noqa: F401
+
+    import mireport.arelle.report_info  # noqa: F401
+
+    with ArelleDaemon(socketPath) as server:
+        L.info(f"Listening on {socketPath}")
+        try:
+            server.serve_forever()
+        finally:
+            socketPath.unlink(missing_ok=True)
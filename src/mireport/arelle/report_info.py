@@ -1,15 +1,16 @@
 import logging
+import os
 import threading
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import cache
 from importlib.metadata import PackageNotFoundError, metadata, version
 from io import BytesIO
+from multiprocessing import get_context
 from pathlib import Path, PurePath
-from typing import BinaryIO, Optional
-
-from arelle import PackageManager, PluginManager
-from arelle.api.Session import Session
-from arelle.CntlrCmdLine import RuntimeOptions
-from arelle.logging.handlers.LogToXmlHandler import LogToXmlHandler
+from tempfile import TemporaryDirectory
+from typing import Any, Optional
 
 from mireport.arelle.support import (
     ArelleProcessingResult,
@@ -17,11 +18,23 @@ from mireport.arelle.support import (
     ArelleVersionHolder,
     VersionInformationTuple,
 )
-from mireport.filesupport import FilelikeAndFileName
+from mireport.filesupport import (
+    AnyFileAndFileName,
+    FilelikeAndFileName,
+    FilePathAndFileName,
+)
 from mireport.xbrlreport import UNCONSTRAINED_REPORT_PACKAGE_JSON
 
+# Anything touching Arelle's module globals (which is anything that imports and
+# calls into Arelle) must hold this; see _runArelle(). Version and viewer URL
+# lookups only read installed package metadata so they never need it.
 BIG_ARELLE_LOCK = threading.Lock()
 
+# Set by startArelleWorkerPool(). When None Arelle is run in this process.
+_WORKER_POOL: Optional[ProcessPoolExecutor] = None
+_WORKER_PROCESSES = 0
+_WORKER_POOL_LOCK = threading.Lock()
+
 L = logging.getLogger(__name__)
 
 
@@ -38,81 +51,62 @@ class ArelleReportProcessor:
         self.taxonomyPackages: list[Path] = []
         if taxonomyPackages is not None:
             self.taxonomyPackages.extend(taxonomyPackages)
+        self._prefetchTaxonomyPackages()
+        # Common to every RuntimeOptions we create. "packages" is copied per
+        # call in case Arelle modifies it.
+        self._packages = tuple(str(t) for t in self.taxonomyPackages)
+        self._baseOptions: dict[str, Any] = dict(
+            internetConnectivity="offline" if self.workOffline else "online",
+            keepOpen=True,
+            logFormat="%(asctime)s [%(messageCode)s] %(message)s - %(file)s",
+            logPropagate=False,
+            # Turn validation on
+            validate=True,
+            # Validate against the unit type registry
+            utrValidate=True,
+            # Warn if inconsistent duplicate facts encountered
+            validateDuplicateFacts="inconsistent",
+        )
 
-    def _run(
-        self,
-        reportPackage: FilelikeAndFileName,
-        options: RuntimeOptions,
-        responseZipStream: Optional[BinaryIO] = None,
-    ) -> ArelleProcessingResult:
-        ###############################
-        #  Arelle is _NOT_ thread safe.
-        ###############################
-        #
-        # If you get rid of this lock then everyone will get each other's
-        # results and files, as well as or instead of their own.
-        #
-        # Example AssertionError: xBRL JSON has gone wrong.['foo.json',
-        # 'xbrlviewer.html', 'ixbrlviewer.js']
-        #
-        # One person's xBRL-JSON has ended up in the same output zip as an XBRL
-        # viewer.
-        #
-        # Example AttributeError [Exception] Failed to complete request:
-        # 'RuntimeOptions' object has no attribute 'useStubViewer' [' File
-        # "C:\\Users\\stuar\\Documents\\efrag\\vsme-converter\\.venv\\Lib\\site-packages\\arelle\\CntlrCmdLine.py",
-        # line 1250, in run\n pluginXbrlMethod(self, options, modelXbrl,
-        # _entrypoint, sourceZipStream=sourceZipStream,
-        # responseZipStream=responseZipStream)\n', ' File
-        # "C:\\Users\\stuar\\Documents\\efrag\\vsme-converter\\.venv\\Lib\\site-packages\\iXBRLViewerPlugin\\__init__.py",
-        # line 299, in commandLineRun\n iXBRLViewerCommandLineXbrlRun(cntlr,
-        # options, modelXbrl, *args, **kwargs)\n', ' File
-        # "C:\\Users\\stuar\\Documents\\efrag\\vsme-converter\\.venv\\Lib\\site-packages\\iXBRLViewerPlugin\\__init__.py",
-        # line 226, in iXBRLViewerCommandLineXbrlRun\n pd.builder =
-        # IXBRLViewerBuilder(cntlr, useStubViewer = options.useStubViewer,
-        # features=getFeaturesFromOptions(options))\n ^^^^^^^^^^^^^^^^^^^^^\n']
-        #
-        #
-        # So we use the BIG_ARELLE_LOCK to make sure we only call in to Arelle
-        # one thread at time, thus making it safe.
-        #
-        with BIG_ARELLE_LOCK:
+    def _prefetchTaxonomyPackages(self) -> None:
+        """Ask the kernel to start reading the taxonomy packages into the page
+        cache now. Arelle opens them itself, by path, so we can't hand it an
+        mmap()ed ZipFile, but this way its many small reads hit memory."""
+        if not hasattr(os, "posix_fadvise"):
+            return
+        for package in self.taxonomyPackages:
             try:
+                fd = os.open(package, os.O_RDONLY)
                 try:
-                    # These survive between calls to Session() so you end up
-                    # with plugins activated when you didn't specify them, like
-                    # the viewer plugin appearing in validateReportPackage()
-                    # output. So hard reset them while protected by the
-                    # BIG_ARELLE_LOCK. close() seems to do stuff that reset()
-                    # forgot about.
-                    PackageManager.reset()
-                    PackageManager.close()
-                    PluginManager.reset()
-                    PluginManager.close()
-                except Exception:
-                    pass
-                with Session() as session:
-                    with reportPackage.fileLike() as requestZipStream:
-                        logHandler = LogToXmlHandler()
-                        session.run(
-                            options,
-                            sourceZipStream=requestZipStream,
-                            responseZipStream=responseZipStream,
-                            logHandler=logHandler,
-                            logFilters=[],
-                        )
-                        logHandler.close()
-                        result = ArelleProcessingResult.fromLogToXmlHandler(logHandler)
-                assert requestZipStream.closed, "Forgot to close the stream."
-                return result
-            except Exception as arelle_exception:
-                L.exception(arelle_exception)
-                raise ArelleRelatedException(
-                    "Exception encountered while validating report."
-                ) from arelle_exception
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            except OSError:
+                # Arelle will report any real problem with the package.
+                pass
+
+    def _run(
+        self, reportPackage: AnyFileAndFileName, options: dict[str, Any]
+    ) -> ArelleProcessingResult:
+        if _WORKER_POOL is None:
+            return _runArelle(reportPackage, options)
+
+        pool = _WORKER_POOL
+        try:
+            result, viewer = pool.submit(
+                _runArelleInWorker, reportPackage, options
+            ).result()
+        except BrokenProcessPool as e:
+            _replaceBrokenWorkerPool(pool)
+            raise ArelleRelatedException(
+                "Arelle worker process died while validating report."
+            ) from e
+        if viewer is not None:
+            options["pluginOptions"]["saveViewerDest"].write(viewer)
+        return result
 
     def validateReportPackage(
-        self, source: FilelikeAndFileName, *, disableCalculationValidation: bool = False
+        self, source: AnyFileAndFileName, *, disableCalculationValidation: bool = False
     ) -> ArelleProcessingResult:
         # Use Calc 1.1 round to nearest "c11r" for calculation validation unless
         # calculation validation is disabled.
@@ -121,65 +115,63 @@ class ArelleReportProcessor:
         else:
             calcs = "c11r"
 
-        validationOptions = RuntimeOptions(
-            internetConnectivity="offline" if self.workOffline is True else "online",
-            keepOpen=True,
-            logFormat="%(asctime)s [%(messageCode)s] %(message)s - %(file)s",
-            logPropagate=False,
-            packages=[str(t) for t in self.taxonomyPackages],
+        validationOptions = dict(
+            **self._baseOptions,
+            packages=list(self._packages),
             # You have to specify a plugin to avoid specifying an entryPointFile. We
             # don't want to specify and entryPointFile as we pass the zipStream in
             # later. saveLoadableOIM is used as a "null" plugin here to passify Arelle.
             plugins="saveLoadableOIM",
             pluginOptions={},
-            # Turn validation on
-            validate=True,
             calcs=calcs,
-            # Validate against the unit type registry
-            utrValidate=True,
-            # Warn if inconsistent duplicate facts encountered
-            validateDuplicateFacts="inconsistent",
         )
         return self._run(source, validationOptions)
 
-    def generateXBRLJson(self, source: FilelikeAndFileName) -> ArelleProcessingResult:
-        filename = "foo.json"
-        jsonOptions = RuntimeOptions(
-            internetConnectivity="offline" if self.workOffline else "online",
-            keepOpen=True,
-            logFormat="%(asctime)s [%(messageCode)s] %(message)s - %(file)s",
-            logPropagate=False,
-            packages=[str(t) for t in self.taxonomyPackages],
-            plugins="saveLoadableOIM",
-            pluginOptions={
-                "saveLoadableOIM": filename,
-            },
-            # Turn validation on
-            validate=True,
-            # Use Calc 1.1 round to nearest "c11r" for calculation validation
-            calcs="c11r",
-            # Validate against the unit type registry
-            utrValidate=True,
-            # Warn if inconsistent duplicate facts encountered
-            validateDuplicateFacts="inconsistent",
-            showOptions=True,
-        )
-        with BytesIO() as fobj:
-            result = self._run(source, jsonOptions, fobj)
-            fobj.seek(0)
-            with zipfile.ZipFile(fobj, "r") as zf:
-                a = zf.infolist()
-                assert len(a) == 1, (
-                    f"Arelle xBRL JSON generation has gone wrong. Zip contents: {zf.namelist()}"
-                )
-                json = zf.read(a[0])
+    def generateXBRLJson(self, source: AnyFileAndFileName) -> ArelleProcessingResult:
+        # Have the plugin write the JSON straight to a file rather than into a
+        # response zip that we'd then have to unpack.
+        with TemporaryDirectory() as tmpDir:
+            jsonPath = Path(tmpDir, "foo.json")
+            jsonOptions = dict(
+                **self._baseOptions,
+                packages=list(self._packages),
+                plugins="saveLoadableOIM",
+                pluginOptions={
+                    "saveLoadableOIM": str(jsonPath),
+                },
+                # Use Calc 1.1 round to nearest "c11r" for calculation validation
+                calcs="c11r",
+                showOptions=True,
+            )
+            result = self._run(source, jsonOptions)
+            try:
+                json = jsonPath.read_bytes()
+            except FileNotFoundError as e:
+                raise ArelleRelatedException(
+                    "Arelle xBRL JSON generation has gone wrong. No JSON written."
+                ) from e
         jsonFilename = PurePath(source.filename).with_suffix(".json").name
         result._xbrlJson = FilelikeAndFileName(fileContent=json, filename=jsonFilename)
         return result
 
     def generateInlineViewer(
-        self, source: FilelikeAndFileName
+        self, source: AnyFileAndFileName
+    ) -> ArelleProcessingResult:
+        return self.validateAndGenerateViewer(source)
+
+    def validateAndGenerateViewer(
+        self, source: AnyFileAndFileName, *, disableCalculationValidation: bool = False
     ) -> ArelleProcessingResult:
+        """Validate the report and generate a viewer for it (including the
+        validation messages) from a single load of the report and its DTS."""
+        # Use Calc 1.1 round to nearest "c11r" for calculation validation unless
+        # calculation validation is disabled.
+        if disableCalculationValidation:
+            calcs = "none"
+        else:
+            calcs = "c11r"
+
+        # The viewer plugin only writes a zip to an in-memory BytesIO.
         viewerFileLike = BytesIO()
         viewer_options = {
             "saveViewerDest": viewerFileLike,
@@ -188,35 +180,27 @@ class ArelleReportProcessor:
             "viewerNoCopyScript": True,
             "viewer_feature_highlight_facts_on_startup": True,
             "useStubViewer": False,
-            "viewerURL": ARELLE_VIEWER_URL,
+            "viewerURL": ArelleReportProcessor._determineViewerUrl(),
         }
 
-        viewerOptions = RuntimeOptions(
-            internetConnectivity="offline" if self.workOffline else "online",
-            keepOpen=True,
-            logFormat="%(asctime)s [%(messageCode)s] %(message)s - %(file)s",
-            logPropagate=False,
-            packages=[str(t) for t in self.taxonomyPackages],
+        viewerOptions = dict(
+            **self._baseOptions,
+            packages=list(self._packages),
             pluginOptions=viewer_options,
             plugins="ixbrl-viewer",
-            # Turn validation on
-            validate=True,
-            # Use Calc 1.1 round to nearest "c11r" for calculation validation
-            calcs="c11r",
-            # Validate against the unit type registry
-            utrValidate=True,
-            # Warn if inconsistent duplicate facts encountered
-            validateDuplicateFacts="inconsistent",
+            calcs=calcs,
             showOptions=True,
         )
-        result = self._run(source, viewerOptions)
-        viewerFileLike.seek(0)
-        with zipfile.ZipFile(viewerFileLike, "r") as zf:
-            a = zf.infolist()
-            assert len(a) == 1, (
-                f"Arelle & inline-viewer has gone wrong. Zip contents: {zf.namelist()}"
-            )
-            viewer = zf.read(a[0])
+        with viewerFileLike:
+            result = self._run(source, viewerOptions)
+            viewerFileLike.seek(0)
+            with zipfile.ZipFile(viewerFileLike, "r") as zf:
+                a = zf.infolist()
+                assert len(a) == 1, (
+                    f"Arelle & inline-viewer has gone wrong. Zip contents: {[i.filename for i in a]}"
+                )
+                with zf.open(a[0]) as member:
+                    viewer = member.read()
         viewerFilename = f"{PurePath(source.filename).stem}_viewer.html"
         result._viewer = FilelikeAndFileName(
             fileContent=viewer, filename=viewerFilename
@@ -235,10 +219,22 @@ class ArelleReportProcessor:
                 f"Supplied {taxonomyPackageDir=} needs to be a string or Path."
             )
 
+        # Same result as tdir.glob("**/*.zip") but scandir()'s cached file
+        # types save a stat() per directory entry.
         taxonomyPackages: list[Path] = []
-        for candidate in tdir.glob("**/*.zip"):
-            if candidate.is_file():
-                taxonomyPackages.append(candidate)
+        directories = [tdir]
+        while directories:
+            try:
+                entries = os.scandir(directories.pop())
+            except OSError:
+                # Missing or unreadable, which glob() silently skips too.
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(Path(entry.path))
+                    elif entry.name.endswith(".zip") and entry.is_file():
+                        taxonomyPackages.append(Path(entry.path))
         if not taxonomyPackages:
             raise ArelleRelatedException(
                 f"Supplied {taxonomyPackageDir=} does not contain any taxonomy packages."
@@ -246,6 +242,7 @@ class ArelleReportProcessor:
         return taxonomyPackages
 
     @staticmethod
+    @cache
     def _determineViewerUrl() -> str:
         try:
             viewer_version = version("ixbrl-viewer")
@@ -257,18 +254,16 @@ class ArelleReportProcessor:
             return an_old_viewer_url
 
     @staticmethod
+    @cache
     def _versionInformation() -> ArelleVersionHolder:
         def makeVersionInformation(distribution: str) -> VersionInformationTuple:
             fallback = VersionInformationTuple(distribution, "<unknown>")
             try:
                 meta = metadata(distribution)
-                a = meta.get_all("Name")
-                b = meta.get_all("Version")
-                if a and b:
-                    return VersionInformationTuple(
-                        name=next(iter(meta.get_all("Name", []))),
-                        version=next(iter(meta.get_all("Version", []))),
-                    )
+                names = meta.get_all("Name")
+                versions = meta.get_all("Version")
+                if names and versions:
+                    return VersionInformationTuple(name=names[0], version=versions[0])
             except Exception as e:
                 L.exception(
                     "Failed to parse Arelle and Arelle ixbrl-viewer metadata",
@@ -282,24 +277,152 @@ class ArelleReportProcessor:
         )
 
 
-ARELLE_VERSION_INFORMATION = ArelleReportProcessor._versionInformation()
-ARELLE_VIEWER_URL = ArelleReportProcessor._determineViewerUrl()
+def __getattr__(name: str) -> Any:
+    # ARELLE_VERSION_INFORMATION and ARELLE_VIEWER_URL are worked out on first
+    # use rather than at import (PEP 562).
+    if name == "ARELLE_VERSION_INFORMATION":
+        return ArelleReportProcessor._versionInformation()
+    if name == "ARELLE_VIEWER_URL":
+        return ArelleReportProcessor._determineViewerUrl()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def startArelleWorkerPool(processes: int) -> None:
+    """Run Arelle in a pool of worker processes from now on, so that up to
+    processes reports can be handled at once. Arelle keeps its state in module
+    globals so each process can still only do one thing at a time."""
+    global _WORKER_POOL, _WORKER_PROCESSES
+    with _WORKER_POOL_LOCK:
+        if _WORKER_POOL is None:
+            _WORKER_PROCESSES = processes
+            _WORKER_POOL = ProcessPoolExecutor(
+                max_workers=processes, mp_context=get_context("spawn")
+            )
+
+
+def _replaceBrokenWorkerPool(broken: ProcessPoolExecutor) -> None:
+    """A pool can't be used once one of its processes has died so start
+    another for subsequent requests."""
+    global _WORKER_POOL
+    with _WORKER_POOL_LOCK:
+        if _WORKER_POOL is broken:
+            broken.shutdown(wait=False)
+            _WORKER_POOL = ProcessPoolExecutor(
+                max_workers=_WORKER_PROCESSES, mp_context=get_context("spawn")
+            )
+
+
+def _runArelle(
+    reportPackage: AnyFileAndFileName, options: dict[str, Any]
+) -> ArelleProcessingResult:
+    ###############################
+    #  Arelle is _NOT_ thread safe.
+    ###############################
+    #
+    # If you get rid of this lock then everyone will get each other's
+    # results and files, as well as or instead of their own.
+    #
+    # Example AssertionError: xBRL JSON has gone wrong.['foo.json',
+    # 'xbrlviewer.html', 'ixbrlviewer.js']
+    #
+    # One person's xBRL-JSON has ended up in the same output zip as an XBRL
+    # viewer.
+    #
+    # Example AttributeError [Exception] Failed to complete request:
+    # 'RuntimeOptions' object has no attribute 'useStubViewer' [' File
+    # "C:\\Users\\stuar\\Documents\\efrag\\vsme-converter\\.venv\\Lib\\site-packages\\arelle\\CntlrCmdLine.py",
+    # line 1250, in run\n pluginXbrlMethod(self, options, modelXbrl,
+    # _entrypoint, sourceZipStream=sourceZipStream,
+    # responseZipStream=responseZipStream)\n', ' File
+    # "C:\\Users\\stuar\\Documents\\efrag\\vsme-converter\\.venv\\Lib\\site-packages\\iXBRLViewerPlugin\\__init__.py",
+    # line 299, in commandLineRun\n iXBRLViewerCommandLineXbrlRun(cntlr,
+    # options, modelXbrl, *args, **kwargs)\n', ' File
+    # "C:\\Users\\stuar\\Documents\\efrag\\vsme-converter\\.venv\\Lib\\site-packages\\iXBRLViewerPlugin\\__init__.py",
+    # line 226, in iXBRLViewerCommandLineXbrlRun\n pd.builder =
+    # IXBRLViewerBuilder(cntlr, useStubViewer = options.useStubViewer,
+    # features=getFeaturesFromOptions(options))\n ^^^^^^^^^^^^^^^^^^^^^\n']
+    #
+    #
+    # So we use the BIG_ARELLE_LOCK to make sure we only call in to Arelle
+    # one thread at time, thus making it safe. For concurrency use
+    # startArelleWorkerPool() and get one Arelle per process instead.
+    #
+    # Arelle drags in hundreds of modules so only import it when it's needed.
+    from arelle import PackageManager, PluginManager
+    from arelle.api.Session import Session
+    from arelle.CntlrCmdLine import RuntimeOptions
+    from arelle.logging.handlers.LogToXmlHandler import LogToXmlHandler
+
+    with BIG_ARELLE_LOCK:
+        try:
+            try:
+                # These survive between calls to Session() so you end up
+                # with plugins activated when you didn't specify them, like
+                # the viewer plugin appearing in validateReportPackage()
+                # output. So hard reset them while protected by the
+                # BIG_ARELLE_LOCK. close() seems to do stuff that reset()
+                # forgot about.
+                PackageManager.reset()
+                PackageManager.close()
+                PluginManager.reset()
+                PluginManager.close()
+            except Exception:
+                pass
+            with Session() as session:
+                with reportPackage.fileLike() as requestZipStream:
+                    logHandler = LogToXmlHandler()
+                    session.run(
+                        RuntimeOptions(**options),
+                        sourceZipStream=requestZipStream,
+                        logHandler=logHandler,
+                        logFilters=[],
+                    )
+                    logHandler.close()
+                    result = ArelleProcessingResult.fromLogToXmlHandler(logHandler)
+            assert requestZipStream.closed, "Forgot to close the stream."
+            return result
+        except Exception as arelle_exception:
+            L.exception(arelle_exception)
+            raise ArelleRelatedException(
+                "Exception encountered while validating report."
+            ) from arelle_exception
+
+
+def _runArelleInWorker(
+    reportPackage: AnyFileAndFileName, options: dict[str, Any]
+) -> tuple[ArelleProcessingResult, Optional[bytes]]:
+    """Runs in a worker process. An in-memory viewer destination can't be
+    shared between processes so its content is returned instead."""
+    viewerDest = None
+    if "saveViewerDest" in (pluginOptions := options.get("pluginOptions", {})):
+        viewerDest = BytesIO()
+        options = {
+            **options,
+            "pluginOptions": {**pluginOptions, "saveViewerDest": viewerDest},
+        }
+    result = _runArelle(reportPackage, options)
+    return result, viewerDest.getvalue() if viewerDest is not None else None
 
 
-def getOrCreateReportPackage(reportPackage: Path) -> FilelikeAndFileName:
-    """"""
+def getOrCreateReportPackage(reportPackage: Path) -> AnyFileAndFileName:
+    """Existing report packages are streamed from disk as Arelle reads them.
+    Inline XBRL files are wrapped in a package in memory."""
     if not isinstance(reportPackage, Path):
         raise ArelleRelatedException(
             f"Passed a report package {reportPackage=} that is not a Path"
         )
 
-    zipName = reportPackage.name
     if zipfile.is_zipfile(reportPackage):
-        with open(reportPackage, "rb") as zin:
-            bytes = zin.read()
+        # No need to read or mmap() the package: Arelle's zipfile seeks and
+        # reads through a buffered file so only the bytes it needs are copied.
+        return FilePathAndFileName(path=reportPackage, filename=reportPackage.name)
     elif reportPackage.suffix in {".xhtml", ".html", ".htm"}:
         with BytesIO() as write_bio:
-            with zipfile.ZipFile(write_bio, "w") as z:
+            # Only ever read once, straight away, by Arelle so don't spend
+            # time compressing it.
+            with zipfile.ZipFile(
+                write_bio, "w", compression=zipfile.ZIP_STORED, allowZip64=True
+            ) as z:
                 z.write(reportPackage, f"a/reports/{reportPackage.name}")
                 z.writestr(
                     zinfo_or_arcname="a/META-INF/reportPackage.json",
@@ -1,14 +1,18 @@
 import json
 import logging
-from dataclasses import dataclass
-from typing import Any, MutableMapping, NamedTuple, Optional, Self
-
-from arelle.logging.handlers.LogToXmlHandler import LogToXmlHandler
-from arelle.ModelValue import QName
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, MutableMapping, NamedTuple, Optional, Self
 
 from mireport.conversionresults import Message, MessageType, Severity
 from mireport.exceptions import MIReportException
 from mireport.filesupport import FilelikeAndFileName
+from mireport.json import loads
+
+if TYPE_CHECKING:
+    from arelle.logging.handlers.LogToXmlHandler import LogToXmlHandler
 
 L = logging.getLogger(__name__)
 
@@ -36,13 +40,19 @@ class ArelleVersionHolder:
         return f"{self.arelle!s}, with {self.ixbrlViewer!s}"
 
 
+@dataclass
+class MessageGroup:
+    """Messages with the same text, severity and type (usually one per fact)."""
+
+    message: Message
+    count: int = 0
+    facts: list[str] = field(default_factory=list)
+
+
 class ArelleProcessingResult:
     """Holds the results of processing an XBRL file with Arelle."""
 
-    _INTERESTING_LOG_MESSAGES = (
-        "validated in",
-        "loaded in",
-    )
+    _INTERESTING_LOG_MESSAGES_RE = re.compile("validated in|loaded in")
 
     def __init__(self, jsonMessages: str, textLogLines: list[str]):
         self._validationMessages: list[Message] = []
@@ -53,8 +63,23 @@ class ArelleProcessingResult:
 
     def __importArelleMessages(self, json_str: str) -> None:
         wantDebug = L.isEnabledFor(logging.DEBUG)
-        records: list[dict] = json.loads(json_str)["log"]
-        for r in records:
+        records: list[dict] = loads(json_str)["log"]
+        # Hoisted out of what can be a loop over tens of thousands of records.
+        isInteresting = ArelleProcessingResult._INTERESTING_LOG_MESSAGES_RE.search
+        fromLogLevelString = Severity.fromLogLevelString
+        append = self._validationMessages.append
+        info, devInfo = Severity.INFO, MessageType.DevInfo
+        xbrlValidation = MessageType.XbrlValidation
+        # The same message is often repeated for thousands of facts so share
+        # one copy of each distinct text.
+        texts: dict[str, str] = {}
+        shared = texts.setdefault
+        # Pop the records in order so each one can be freed as soon as it's
+        # been turned into a Message rather than all living until the end.
+        records.reverse()
+        pop = records.pop
+        while records:
+            r = pop()
             code: str = r.get("code", "")
             level: str = r.get("level", "")
             text: str = r.get("message", {}).get("text", "")
@@ -70,30 +95,21 @@ class ArelleProcessingResult:
 
             match code:
                 case "info" | "":
-                    if "" == code or any(
-                        a in text
-                        for a in ArelleProcessingResult._INTERESTING_LOG_MESSAGES
-                    ):
-                        self._validationMessages.append(
-                            Message(
-                                messageText=text,
-                                severity=Severity.INFO,
-                                messageType=MessageType.DevInfo,
-                            )
-                        )
+                    if "" == code or isInteresting(text) is not None:
+                        append(Message(shared(text, text), info, devInfo))
                 case _:
                     messageText = f"[{code}] {text}"
-                    self._validationMessages.append(
+                    append(
                         Message(
-                            messageText=messageText,
-                            severity=Severity.fromLogLevelString(level),
-                            messageType=MessageType.XbrlValidation,
-                            conceptQName=fact,
+                            shared(messageText, messageText),
+                            fromLogLevelString(level),
+                            xbrlValidation,
+                            fact,
                         )
                     )
 
     @classmethod
-    def fromLogToXmlHandler(cls, logHandler: LogToXmlHandler) -> Self:
+    def fromLogToXmlHandler(cls, logHandler: "LogToXmlHandler") -> Self:
         json = logHandler.getJson(clearLogBuffer=False)
         logLines = logHandler.getLines(clearLogBuffer=False)
         logHandler.clearLogBuffer()
@@ -111,17 +127,34 @@ class ArelleProcessingResult:
             return self._xbrlJson
         raise ArelleRelatedException("No JSON stored/retrieved.")
 
-    @property
-    def messages(self) -> list[Message]:
-        return list(self._validationMessages)
-
-    @property
-    def logLines(self) -> list[str]:
-        return list(self._textLogLines)
+    @cached_property
+    def messages(self) -> Sequence[Message]:
+        # Complete once constructed so hand out one immutable copy.
+        return tuple(self._validationMessages)
+
+    @cached_property
+    def logLines(self) -> Sequence[str]:
+        return tuple(self._textLogLines)
+
+    @cached_property
+    def groupedMessages(self) -> Sequence[MessageGroup]:
+        """The messages grouped by text, severity and type, in the order each
+        was first seen, with the facts they were reported against."""
+        groups: dict[tuple[str, Severity, MessageType], MessageGroup] = {}
+        for m in self._validationMessages:
+            key = (m.messageText, m.severity, m.messageType)
+            if (group := groups.get(key)) is None:
+                group = groups[key] = MessageGroup(m)
+            group.count += 1
+            if m.conceptQName is not None:
+                group.facts.append(m.conceptQName)
+        return tuple(groups.values())
 
 
 class ArelleObjectJSONEncoder(json.JSONEncoder):
     def default(self, o: Any) -> Any:
+        from arelle.ModelValue import QName
+
         if isinstance(o, QName):
             return str(o)
         # Let the base class default method raise the TypeError
@@ -131,15 +164,21 @@ class ArelleObjectJSONEncoder(json.JSONEncoder):
     def tidyKeys(obj: Any) -> Any:
         """default(obj) only works on objects not keys so use this method to
         preprocess your JSON payload and convert QName keys to str keys."""
+        from arelle.ModelValue import QName
+
+        tidyKeys = ArelleObjectJSONEncoder.tidyKeys
         if isinstance(obj, MutableMapping):
-            keys = list(obj.keys())
-            for k in keys:
-                new_k = k
-                if isinstance(k, QName):
-                    new_k = str(k)
-                new_value = ArelleObjectJSONEncoder.tidyKeys(obj.pop(k))
-                obj[new_k] = new_value
-        elif isinstance(obj, (list, tuple)):
+            # Rebuild in one pass rather than popping and re-adding every key.
+            tidied = {
+                (str(k) if isinstance(k, QName) else k): tidyKeys(v)
+                for k, v in obj.items()
+            }
+            obj.clear()
+            obj.update(tidied)
+        elif isinstance(obj, list):
+            for i, item in enumerate(obj):
+                obj[i] = tidyKeys(item)
+        elif isinstance(obj, tuple):
             for item in obj:
-                ArelleObjectJSONEncoder.tidyKeys(item)
+                tidyKeys(item)
         return obj
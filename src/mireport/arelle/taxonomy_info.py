@@ -1,9 +1,10 @@
-import json
 import logging
 import time
 from collections import defaultdict
-from collections.abc import Iterable
-from typing import Any, Optional, TypeVar
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from operator import attrgetter
+from typing import Any, Optional
 
 from arelle import XbrlConst
 from arelle.api.Session import Session
@@ -24,13 +25,50 @@ from mireport.arelle.support import (
 )
 from mireport.taxonomy import MEASUREMENT_GUIDANCE_LABEL_ROLE
 
-PLUGIN_NAME = "Taxonomy Information Extractor"
-T = TypeVar("T")
+try:
+    # orjson is an optional speed-up, several times faster than json.dump.
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
+PLUGIN_NAME = "Taxonomy Information Extractor"
+_WRITE_BUFFER_SIZE = 64 * 1024
+# Keyed by sortKeys. Encoders hold no per-call state so one of each will do;
+# ensure_ascii=False matches orjson's output byte for byte.
+_JSON_ENCODERS = {
+    sortKeys: ArelleObjectJSONEncoder(indent=2, sort_keys=sortKeys, ensure_ascii=False)
+    for sortKeys in (True, False)
+}
 
-def unique_list(i: Iterable[T]) -> list[T]:
-    # N.B. This maintains insertion order where list(set()) does not.
-    return list(dict.fromkeys(i))
+# Namespaces whose item declarations (xbrli:item, xbrldt:dimensionItem etc.)
+# aren't reportable concepts.
+_SKIP_NS = frozenset({XbrlConst.xbrli, XbrlConst.xbrldt})
+
+# The UtrEntry fields we write out, read in one call by _UTR_GETTER.
+_UTR_KEYS = (
+    "unitId",
+    "unitName",
+    "nsUnit",
+    "itemType",
+    "nsItemType",
+    "numeratorItemType",
+    "nsNumeratorItemType",
+    "definition",
+    "denominatorItemType",
+    "nsDenominatorItemType",
+    "symbol",
+    "status",
+)
+_UTR_GETTER = attrgetter(*_UTR_KEYS)
+
+# (JSON key, ModelConcept property) for the flags only written out when true.
+_META_ATTRS = (
+    ("abstract", "isAbstract"),
+    ("dimension", "isDimensionItem"),
+    ("hypercube", "isHypercubeItem"),
+    ("nillable", "isNillable"),
+    ("numeric", "isNumeric"),
+)
 
 
 def callArelleForTaxonomyInfo(
@@ -70,9 +108,21 @@ def callArelleForTaxonomyInfo(
     return results
 
 
+# A relationship reduced to what the network walks need:
+# (toModelObject, isUsable, arcrole, targetRole).
+_Edge = tuple[ModelConcept, bool, str, Optional[str]]
+
+
 class TaxonomyInfoPluginData(PluginData):
-    Taxonomy: dict = dict()
-    UTR: dict = dict()
+    Taxonomy: dict
+    UTR: dict
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        # Per instance; class level dicts would carry one run's data into the
+        # next when Arelle is run more than once in the same process.
+        self.Taxonomy = {}
+        self.UTR = {}
 
 
 def pluginData(cntlr: Cntlr) -> TaxonomyInfoPluginData:
@@ -87,17 +137,44 @@ def writeDataFile(
     cntlr: Cntlr,
     jsonPath: str,
     dataType: str,
+    sortKeys: bool = True,
 ) -> None:
+    """Write the plugin's dataType payload to jsonPath. sortKeys gives output
+    that stays stable across taxonomy and Arelle versions, which the packaged
+    data files need; turn it off for throwaway output."""
     pdata = pluginData(cntlr)
     data = getattr(pdata, dataType, None)
     if not data:
         cntlr.addToLog(f"No {dataType} data to write")
         return
 
-    with open(jsonPath, "w", encoding="UTF-8") as f:
-        tidied = ArelleObjectJSONEncoder.tidyKeys(data)
-        json.dump(tidied, f, indent=2, sort_keys=True, cls=ArelleObjectJSONEncoder)
-        cntlr.addToLog(f"{dataType} data written to {jsonPath}")
+    # tidyKeys() works in place so the payload isn't copied.
+    tidied = ArelleObjectJSONEncoder.tidyKeys(data)
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        if sortKeys:
+            option |= orjson.OPT_SORT_KEYS
+        # Encode one top level section at a time so only the largest section,
+        # rather than the whole document, is ever held as bytes. Re-indenting
+        # each section by one level gives exactly what a single dumps() would
+        # (JSON strings can't contain a raw newline).
+        keys = sorted(tidied) if sortKeys else list(tidied)
+        default = _JSON_ENCODERS[sortKeys].default
+        with open(jsonPath, "wb") as f:
+            f.write(b"{")
+            for n, key in enumerate(keys):
+                section = orjson.dumps(tidied[key], default=default, option=option)
+                f.write(b",\n  " if n else b"\n  ")
+                f.write(orjson.dumps(key))
+                f.write(b": ")
+                f.write(section.replace(b"\n", b"\n  "))
+            f.write(b"\n}")
+    else:
+        # The encoded text is never held as a whole; the (many, small) chunks
+        # go straight to the file through a larger than default buffer.
+        with open(jsonPath, "w", encoding="UTF-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.writelines(_JSON_ENCODERS[sortKeys].iterencode(tidied))
+    cntlr.addToLog(f"{dataType} data written to {jsonPath}")
 
 
 class UTRInfoExtractor:
@@ -131,31 +208,20 @@ class UTRInfoExtractor:
         """Get the UTR entries from the modelXbrl."""
         # N.B. UTR schema primary key is the status and unitId
         jUTR: list[dict] = []
-        interestingKeys = [
-            "unitId",
-            "unitName",
-            "nsUnit",
-            "itemType",
-            "nsItemType",
-            "numeratorItemType",
-            "nsNumeratorItemType",
-            "definition",
-            "denominatorItemType",
-            "nsDenominatorItemType",
-            "symbol",
-            "status",
-        ]
-        utrEntries = [
-            u
-            for dataTypeIsh in self.utrModel.keys()
-            for u in self.utrModel[dataTypeIsh].values()
-        ]
-        for entry in sorted(utrEntries, key=lambda e: e.unitId):
-            jEntry = {}
-            for key in interestingKeys:
-                if (value := getattr(entry, key)) is not None and value.strip() != "":
-                    jEntry[key] = value
-            jUTR.append(jEntry)
+        utrEntries = sorted(
+            chain.from_iterable(m.values() for m in self.utrModel.values()),
+            key=attrgetter("status", "unitId"),
+        )
+        for entry in utrEntries:
+            jUTR.append(
+                {
+                    key: value
+                    for key, value in zip(_UTR_KEYS, _UTR_GETTER(entry))
+                    # isspace() is False for "" so check truthiness too;
+                    # neither allocates the way strip() would.
+                    if value and not value.isspace()
+                }
+            )
         return jUTR
 
 
@@ -164,11 +230,44 @@ class TaxonomyInfoExtractor:
         self.cntlr: Cntlr = cntlr
         self.options: RuntimeOptions = options
         self.modelXbrl: ModelXbrl = modelXbrl
-        self.taxonomyJson: dict[str, dict] = defaultdict(dict)
+        self.taxonomyJson: dict[str, Any] = {}
+        # A line per ELR is only worth formatting and handing to Arelle's log
+        # handlers when someone is going to see it.
+        logger = getattr(cntlr, "logger", None)
+        self._logEachElr: bool = logger is not None and logger.isEnabledFor(
+            logging.DEBUG
+        )
+        self._relSetCache: dict[tuple[Any, Optional[str]], ModelRelationshipSet] = {}
+        self._domainWalkCache: dict[tuple[str, QName], list[QName]] = {}
+        self._primaryItemsCache: dict[tuple[str, QName], list[tuple[int, QName]]] = {}
+        self._relSetSnapshots: dict[
+            ModelRelationshipSet, dict[ModelConcept, list[_Edge]]
+        ] = {}
+        # arcrole -> ELRs with base sets for it, filled in by extract().
+        self._elrsByArcrole: dict[str, list[str]] = defaultdict(list)
+
+    def _relSet(
+        self, arcrole: str | tuple[str, ...], elrUri: Optional[str] = None
+    ) -> ModelRelationshipSet:
+        """modelXbrl.relationshipSet() but remembered as the same few sets are
+        asked for again and again while walking the networks."""
+        key = (arcrole, elrUri)
+        if (relSet := self._relSetCache.get(key)) is None:
+            relSet = self._relSetCache[key] = self.modelXbrl.relationshipSet(
+                arcrole, elrUri
+            )
+        return relSet
 
     def extract(self) -> None:
         self.taxonomyJson["entryPoint"] = self.options.entrypointFile
 
+        # One scan of the base sets rather than one per network we extract.
+        self._elrsByArcrole.clear()
+        for arcroleUri, elrUri, linkqname, arcqname in self.modelXbrl.baseSets.keys():
+            if linkqname is None or arcqname is None or elrUri is None:
+                continue
+            self._elrsByArcrole[arcroleUri].append(elrUri)
+
         self.extractPresentation()
         self.extractDimensionDefinitions()
         self.extractConceptsAndMetadata()
@@ -177,6 +276,11 @@ class TaxonomyInfoExtractor:
         self.taxonomyJson["namespaces"] = self.modelXbrl.prefixedNamespaces
         pdata = pluginData(self.cntlr)
         pdata.Taxonomy.update(self.taxonomyJson)
+        # The walks are done; don't keep the model's relationships alive.
+        self._relSetCache.clear()
+        self._relSetSnapshots.clear()
+        self._domainWalkCache.clear()
+        self._primaryItemsCache.clear()
 
         if self.options.utrValidate:
             self.cntlr.addToLog(
@@ -185,36 +289,116 @@ class TaxonomyInfoExtractor:
             utrExtractor = UTRInfoExtractor(self.cntlr, self.modelXbrl, pdata)
             utrExtractor.extract()
 
+    def _children(
+        self, relSet: ModelRelationshipSet, concept: ModelConcept
+    ) -> list[_Edge]:
+        """relSet.fromModelObject(concept) as plain tuples. ModelRelationship
+        properties such as targetRole and isUsable are XML attribute lookups
+        each time they are read; this reads them once per relationship no
+        matter how many walks cross it."""
+        snapshot = self._relSetSnapshots.setdefault(relSet, {})
+        if (edges := snapshot.get(concept)) is None:
+            edges = snapshot[concept] = [
+                (rel.toModelObject, rel.isUsable, rel.arcrole, rel.targetRole)
+                for rel in relSet.fromModelObject(concept)
+            ]
+        return edges
+
+    def iterDescendants(
+        self,
+        parent_concept: ModelConcept,
+        relSet: ModelRelationshipSet,
+        indent: int,
+        visited: Optional[set[tuple[ModelRelationshipSet, ModelConcept]]] = None,
+    ) -> Iterator[tuple[int, ModelConcept, bool]]:
+        """Yields (indent, concept, usable) for each descendant of
+        parent_concept, depth first in relationship order. Iterative so deep
+        networks can't hit the recursion limit.
+
+        A concept reachable by more than one path is yielded for each path but,
+        if visited is given, its descendants are only walked the first time it
+        is reached in a given relationship set."""
+        relationshipSet = self._relSet
+        if visited is not None:
+            visited.add((relSet, parent_concept))
+        children = self._children
+        # One entry per level: the unvisited edges from that level's concept,
+        # the relationship set they came from and their indent.
+        stack: list[tuple[Iterator[_Edge], ModelRelationshipSet, int]] = [
+            (iter(children(relSet, parent_concept)), relSet, indent)
+        ]
+        while stack:
+            edges, currentRelSet, depth = stack[-1]
+            if (edge := next(edges, None)) is None:
+                stack.pop()
+                continue
+            child_concept, usable, arcrole, targetRole = edge
+            yield depth, child_concept, usable
+            if targetRole:
+                childRelSet = relationshipSet(arcrole, targetRole)
+            else:
+                childRelSet = currentRelSet
+            if visited is not None:
+                if (childRelSet, child_concept) in visited:
+                    continue
+                visited.add((childRelSet, child_concept))
+            stack.append(
+                (iter(children(childRelSet, child_concept)), childRelSet, depth + 1)
+            )
+
     def walkChildren(
         self,
         parent_concept: ModelConcept,
         relSet: ModelRelationshipSet,
-        rows: list[tuple[int, QName, bool | None]],
+        rows: list[tuple[int, QName]],
         indent: int,
-        includeUsable: bool = False,
     ) -> None:
-        for rel in relSet.fromModelObject(parent_concept):
-            child_concept = rel.toModelObject
-            if includeUsable:
-                rows.append((indent, child_concept.qname, rel.isUsable))
-            else:
-                rows.append((indent, child_concept.qname, None))
-            if rel.targetRole:
-                childRelSet = self.modelXbrl.relationshipSet(
-                    rel.arcrole, rel.targetRole
-                )
-            else:
-                childRelSet = relSet
-            self.walkChildren(
-                child_concept, childRelSet, rows, indent + 1, includeUsable
+        """Appends an (indent, qname) row for each descendant of
+        parent_concept."""
+        rows.extend(
+            (depth, concept.qname)
+            for depth, concept, _ in self.iterDescendants(
+                parent_concept, relSet, indent
             )
+        )
+
+    def collectUsableQNames(
+        self,
+        parent_concept: ModelConcept,
+        relSet: ModelRelationshipSet,
+        seen: set[QName],
+        out: list[QName],
+    ) -> None:
+        """Appends the QName of each usable descendant of parent_concept not
+        already in seen. Keeps first-seen order without building the rows
+        walkChildren() would. Shared subtrees are only walked once; everything
+        in them was collected the first time."""
+        visited: set[tuple[ModelRelationshipSet, ModelConcept]] = set()
+        for _, concept, usable in self.iterDescendants(
+            parent_concept, relSet, 1, visited
+        ):
+            if usable and (qname := concept.qname) not in seen:
+                seen.add(qname)
+                out.append(qname)
 
     def getPrimaryItems(
         self, elrUri: str, root_concept: ModelConcept
     ) -> list[tuple[int, QName]]:
-        relSet = self.modelXbrl.relationshipSet(XbrlConst.domainMember, elrUri)
-        rows: list[tuple[int, QName, bool | None]] = []
-        rows.append((0, root_concept.qname, None))
+        """The (indent, qname) rows of root_concept's primary items in elrUri.
+        Remembered as the same primary item tree is usually shared by several
+        hypercubes. Callers must not modify the result."""
+        key = (elrUri, root_concept.qname)
+        if (rows := self._primaryItemsCache.get(key)) is None:
+            rows = self._primaryItemsCache[key] = self._walkPrimaryItems(
+                elrUri, root_concept
+            )
+        return rows
+
+    def _walkPrimaryItems(
+        self, elrUri: str, root_concept: ModelConcept
+    ) -> list[tuple[int, QName]]:
+        relSet = self._relSet(XbrlConst.domainMember, elrUri)
+        rows: list[tuple[int, QName]] = [(0, root_concept.qname)]
         if root_concept not in relSet.rootConcepts:
             self.cntlr.addToLog(
                 f"WARNING: {elrUri} has no primary items attached to hypercube beyond {root_concept.qname} (no outgoing domain-member relationships).",
@@ -226,12 +410,12 @@ class TaxonomyInfoExtractor:
             f"{elrUri} {root_concept} should be in [{', '.join(str(r.qname) for r in relSet.rootConcepts)}]"
         )
         self.walkChildren(root_concept, relSet, rows, 1)
-        return [(i, qname) for i, qname, _ in rows]
+        return rows
 
     def getDimensions(
         self, elrUri: str, hypercube: ModelConcept, hypercubeIsClosed: bool
     ) -> list[tuple[ModelConcept, str]]:
-        relSet = self.modelXbrl.relationshipSet(XbrlConst.hypercubeDimension, elrUri)
+        relSet = self._relSet(XbrlConst.hypercubeDimension, elrUri)
         roots = relSet.rootConcepts
 
         if not roots:
@@ -256,26 +440,23 @@ class TaxonomyInfoExtractor:
         explicitDimension: ModelConcept,
         elrUri: str,
     ) -> list[QName]:
-        dimensionDomainRelSet = self.modelXbrl.relationshipSet(
-            XbrlConst.dimensionDomain, elrUri
-        )
+        dimensionDomainRelSet = self._relSet(XbrlConst.dimensionDomain, elrUri)
 
         assert explicitDimension in dimensionDomainRelSet.rootConcepts, (
             f"Dimension {explicitDimension.qname} should be in {dimensionDomainRelSet.rootConcepts}"
         )
-        domainRoots: list[tuple[ModelConcept, bool, ModelRelationshipSet]] = [
+        domainRoots: list[tuple[ModelConcept, bool, str, ModelRelationshipSet]] = [
             (
                 rel.toModelObject,
                 rel.isUsable,
-                self.modelXbrl.relationshipSet(
-                    XbrlConst.domainMember, rel.consecutiveLinkrole
-                ),
+                rel.consecutiveLinkrole,
+                self._relSet(XbrlConst.domainMember, rel.consecutiveLinkrole),
             )
             for rel in dimensionDomainRelSet.fromModelObject(explicitDimension)
         ]
 
-        for domainConcept, _, domainMemberRelSet in domainRoots:
-            outgoing = domainMemberRelSet.fromModelObject(domainConcept)
+        for domainConcept, _, _, domainMemberRelSet in domainRoots:
+            outgoing = self._children(domainMemberRelSet, domainConcept)
             incoming = domainMemberRelSet.toModelObject(domainConcept)
             if 0 == len(outgoing):
                 self.cntlr.addToLog(
@@ -288,39 +469,50 @@ class TaxonomyInfoExtractor:
                     level=logging.WARNING,
                 )
 
-        rows: list[tuple[int, QName, bool | None]] = []
-        for domainConcept, usable, domainMemberRelSet in domainRoots:
-            rows.append((0, domainConcept.qname, usable))
-            self.walkChildren(
-                domainConcept, domainMemberRelSet, rows, 1, includeUsable=True
+        seen: set[QName] = set()
+        members: list[QName] = []
+        for domainConcept, usable, domainElr, _ in domainRoots:
+            descendants = self.getUsableDescendants(domainElr, domainConcept)
+            candidates: Iterable[QName] = (
+                chain((domainConcept.qname,), descendants) if usable else descendants
             )
-        return unique_list(q for _, q, usable in rows if usable)
+            for qname in candidates:
+                if qname not in seen:
+                    seen.add(qname)
+                    members.append(qname)
+        return members
 
     def getDomainMembersForEE(
         self, elrUri: str, headUsable: bool, domainConcept: ModelConcept
     ) -> list[QName]:
         """Deliberately over simplified for now."""
-        domainMemberRelSet = self.modelXbrl.relationshipSet(
-            XbrlConst.domainMember, elrUri
-        )
-        rows: list[tuple[int, QName, bool | None]] = []
-        self.walkChildren(
-            domainConcept, domainMemberRelSet, rows, 1, includeUsable=True
-        )
-        if headUsable:
-            rows.insert(0, (0, domainConcept.qname, headUsable))
-        return unique_list(q for _, q, usable in rows if usable)
+        descendants = self.getUsableDescendants(elrUri, domainConcept)
+        if not headUsable:
+            return list(descendants)
+        head = domainConcept.qname
+        return [head, *(qname for qname in descendants if qname != head)]
+
+    def getUsableDescendants(
+        self, elrUri: str, domainConcept: ModelConcept
+    ) -> list[QName]:
+        """The distinct usable members below domainConcept in elrUri's
+        domain-member network. Remembered as the same domains turn up under
+        many dimensions and hypercubes. Callers must not modify the result."""
+        key = (elrUri, domainConcept.qname)
+        if (members := self._domainWalkCache.get(key)) is None:
+            members = self._domainWalkCache[key] = []
+            self.collectUsableQNames(
+                domainConcept,
+                self._relSet(XbrlConst.domainMember, elrUri),
+                set(),
+                members,
+            )
+        return members
 
     def getDimensionDefaults(self) -> dict[QName, QName]:
         defaults: dict[QName, QName] = {}
-        elrsWithDefaults = set()
-        for arcroleUri, elrUri, linkqname, arcqname in self.modelXbrl.baseSets.keys():
-            if arcroleUri == XbrlConst.dimensionDefault and elrUri is not None:
-                elrsWithDefaults.add(elrUri)
-        for elrUri in elrsWithDefaults:
-            dimensionDefaultRelSet = self.modelXbrl.relationshipSet(
-                XbrlConst.dimensionDefault, elrUri
-            )
+        for elrUri in set(self._elrsByArcrole[XbrlConst.dimensionDefault]):
+            dimensionDefaultRelSet = self._relSet(XbrlConst.dimensionDefault, elrUri)
             dimensions: list[ModelConcept] = dimensionDefaultRelSet.rootConcepts
             for d in dimensions:
                 members: list[ModelConcept] = [
@@ -336,179 +528,195 @@ class TaxonomyInfoExtractor:
                 defaults[d.qname] = members[0].qname
         return defaults
 
-    def addConceptMetadata(self, concept: ModelConcept, jconcept: dict) -> None:
-        meta = {
-            "abstract": "isAbstract",
-            "dimension": "isDimensionItem",
-            "hypercube": "isHypercubeItem",
-            "nillable": "isNillable",
-            "numeric": "isNumeric",
-        }
-        for json_key, concept_property in meta.items():
-            if (value := getattr(concept, concept_property)) is True:
-                jconcept[json_key] = value
+    def getEnglishLabels(
+        self, concept: ModelConcept, roles: Iterable[str]
+    ) -> dict[str, Optional[str]]:
+        """concept.label(preferredLabel=role, lang="en", strip=True) for each of
+        roles but from a single pass over the concept's label relationships.
+        Like Arelle, the first exact xml:lang match wins; only roles that
+        exist solely in other languages go back to concept.label() for its
+        language fallback."""
+        exact: dict[str, str] = {}
+        otherLanguages: set[str] = set()
+        for rel in self._relSet(XbrlConst.conceptLabel).fromModelObject(concept):
+            label = rel.toModelObject
+            if label.xmlLang == "en":
+                exact.setdefault(label.role, label.textValue)
+            else:
+                otherLanguages.add(label.role)
+        labels: dict[str, Optional[str]] = {}
+        for role in roles:
+            if (text := exact.get(role)) is not None:
+                labels[role] = text.strip()
+            elif role in otherLanguages:
+                labels[role] = concept.label(
+                    fallbackToQname=False, preferredLabel=role, lang="en", strip=True
+                )
+            else:
+                labels[role] = None
+        return labels
 
     def extractConceptsAndMetadata(self) -> None:
         self.cntlr.addToLog("Processing concepts (including labels and references)")
-        for qname, concept in sorted(self.modelXbrl.qnameConcepts.items()):
-            if concept.isItem:
-                if concept.qname.namespaceURI in (XbrlConst.xbrli, XbrlConst.xbrldt):
-                    # We don't need/want xbrli:item, xbrldt:dimensionItem or
-                    # xbrldt:hypercubeItem in our concept list. Arelle docs
-                    # suggests isItem should supress xbrli:item but it doesn't.
-                    continue
-                jconcept = {
-                    # We use concept.type.qname as it gets the namespace prefix
-                    # right, i.e. something defined in modelXbrl.prefixedNamespace.
-                    # concept.typeQname works almost the same but prefers to use a
-                    # prefix from ?the defining schema? and can use one that is not
-                    # defined in modelXbrl.prefixedNamespace which makes it
-                    # impossible to find the namespace
-                    "dataType": concept.type.qname,
-                    "baseDataType": concept.baseXbrliTypeQname,
-                    "periodType": concept.periodType,
-                    "labels": {
-                        "en": {
-                            XbrlConst.standardLabel: concept.label(
-                                fallbackToQname=False,
-                                preferredLabel=XbrlConst.standardLabel,
-                                lang="en",
-                                strip=True,
-                            ),
-                        }
-                    },
-                }
-                self.addConceptMetadata(concept, jconcept)
-
-                if (
-                    measurement := concept.label(
-                        fallbackToQname=False,
-                        preferredLabel=MEASUREMENT_GUIDANCE_LABEL_ROLE,
-                        lang="en",
-                        strip=True,
-                    )
-                ) is not None:
-                    jconcept["labels"]["en"][MEASUREMENT_GUIDANCE_LABEL_ROLE] = (
-                        measurement
-                    )
+        standardLabel = XbrlConst.standardLabel
+        measurementLabel = MEASUREMENT_GUIDANCE_LABEL_ROLE
+        documentationLabel = XbrlConst.documentationLabel
+        labelRoles = (standardLabel, measurementLabel, documentationLabel)
+        # Bound once as the loop below runs for every concept in the taxonomy.
+        getEnglishLabels = self.getEnglishLabels
+        concepts: dict[QName, dict[str, Any]] = {}
+        self.taxonomyJson["concepts"] = concepts
+        # No need to sort here; writeDataFile() sorts the keys on output.
+        for qname, concept in self.modelXbrl.qnameConcepts.items():
+            if not concept.isItem or concept.qname.namespaceURI in _SKIP_NS:
+                # We don't need/want xbrli:item, xbrldt:dimensionItem or
+                # xbrldt:hypercubeItem in our concept list. Arelle docs suggests
+                # isItem should supress xbrli:item but it doesn't.
+                continue
+            labels = getEnglishLabels(concept, labelRoles)
+            other: dict[str, Any] = {}
+            jconcept = {
+                # We use concept.type.qname as it gets the namespace prefix
+                # right, i.e. something defined in modelXbrl.prefixedNamespace.
+                # concept.typeQname works almost the same but prefers to use a
+                # prefix from ?the defining schema? and can use one that is not
+                # defined in modelXbrl.prefixedNamespace which makes it
+                # impossible to find the namespace
+                "dataType": concept.type.qname,
+                "baseDataType": concept.baseXbrliTypeQname,
+                "periodType": concept.periodType,
+                "labels": {
+                    "en": {
+                        standardLabel: labels[standardLabel],
+                    }
+                },
+            }
+            for jsonKey, conceptProperty in _META_ATTRS:
+                if getattr(concept, conceptProperty) is True:
+                    jconcept[jsonKey] = True
 
-                if (
-                    documentation := concept.label(
-                        fallbackToQname=False,
-                        preferredLabel=XbrlConst.documentationLabel,
-                        lang="en",
-                        strip=True,
-                    )
-                ) is not None:
-                    jconcept["labels"]["en"][XbrlConst.documentationLabel] = (
-                        documentation
-                    )
+            if (measurement := labels[measurementLabel]) is not None:
+                jconcept["labels"]["en"][measurementLabel] = measurement
 
-                if concept.isEnumeration and not concept.isEnumeration2Item:
-                    self.cntlr.addToLog(
-                        f"Warning extensible enumerations other than 2.0 are not supported. {concept.qname}",
-                        level=logging.WARN,
-                    )
-                if concept.isEnumeration2Item:
-                    # is this even needed? We can lookup the labels, get the concept
-                    # names and bung them in without using this. If this had a list
-                    # of the valid qnames for the domain, this would act as a check
-                    # that the chosen name is valid for the domain.
-                    headUsable = concept.isEnumDomainUsable
-                    linkrole = concept.enumLinkrole
-                    jconcept.setdefault("other", {})["ee20DomainMembers"] = (
-                        self.getDomainMembersForEE(
-                            linkrole,
-                            headUsable,
-                            self.modelXbrl.qnameConcepts[concept.enumDomainQname],
-                        )
-                    )
-                if concept.isTypedDimension:
-                    jconcept.setdefault("other", {})["typedElement"] = (
-                        concept.typedDomainElement.qname
-                    )
-                self.taxonomyJson["concepts"][qname] = jconcept
+            if (documentation := labels[documentationLabel]) is not None:
+                jconcept["labels"]["en"][documentationLabel] = documentation
+
+            if concept.isEnumeration and not concept.isEnumeration2Item:
+                self.cntlr.addToLog(
+                    f"Warning extensible enumerations other than 2.0 are not supported. {concept.qname}",
+                    level=logging.WARN,
+                )
+            if concept.isEnumeration2Item:
+                # is this even needed? We can lookup the labels, get the concept
+                # names and bung them in without using this. If this had a list
+                # of the valid qnames for the domain, this would act as a check
+                # that the chosen name is valid for the domain.
+                headUsable = concept.isEnumDomainUsable
+                linkrole = concept.enumLinkrole
+                other["ee20DomainMembers"] = self.getDomainMembersForEE(
+                    linkrole,
+                    headUsable,
+                    self.modelXbrl.qnameConcepts[concept.enumDomainQname],
+                )
+            if concept.isTypedDimension:
+                other["typedElement"] = concept.typedDomainElement.qname
+            if other:
+                jconcept["other"] = other
+            concepts[qname] = jconcept
 
     def extractDimensionDefinitions(self) -> None:
         self.cntlr.addToLog("Processing dimensions")
-        self.taxonomyJson["dimensions"] = defaultdict(dict)
+        dimensions: dict[str, dict] = {}
+        self.taxonomyJson["dimensions"] = dimensions
         # Get the hypercubes and primary items
-        hypercubeArcRoles = (XbrlConst.all, XbrlConst.notAll)
-        for arcroleUri, elrUri, linkqname, arcqname in self.modelXbrl.baseSets.keys():
-            if linkqname is None or arcqname is None:
-                continue
-            if arcroleUri in hypercubeArcRoles and elrUri is not None:
-                relSet = self.modelXbrl.relationshipSet(hypercubeArcRoles, elrUri)
-                for root_concept in relSet.rootConcepts:
-                    for rel in relSet.fromModelObject(root_concept):
-                        concept: ModelConcept = rel.toModelObject
-                        if concept.isHypercubeItem:
-                            cube = {
-                                "primaryItems": self.getPrimaryItems(
-                                    rel.consecutiveLinkrole, root_concept
-                                ),
-                                "xbrldt:contextElement": rel.contextElement,
-                                "xbrldt:closed": rel.isClosed,
-                            }
-                            for dimension, consecutiveElr in self.getDimensions(
-                                rel.consecutiveLinkrole, concept, rel.isClosed
-                            ):
-                                if dimension.isExplicitDimension:
-                                    cube.setdefault("explicitDimensions", {})[
-                                        dimension.qname
-                                    ] = self.getDomainMembersForExplicitDimension(
-                                        dimension, consecutiveElr
-                                    )
-                                elif dimension.isTypedDimension:
-                                    cube.setdefault("typedDimensions", []).append(
-                                        dimension.qname
-                                    )
-                            self.taxonomyJson["dimensions"][elrUri][concept.qname] = (
-                                cube
-                            )
-                        else:
-                            raise ArelleRelatedException(
-                                f"Found a {concept} but expected a hypercube."
-                            )
+        elrsByArcrole = self._elrsByArcrole
+        # An ELR with both all and notAll arcs (or several link elements) is
+        # listed more than once but one relationship set covers it. As with
+        # the presentation, the ELRs are walked serially as Arelle fills its
+        # relationship indexes lazily.
+        for elrUri in dict.fromkeys(
+            elrsByArcrole[XbrlConst.all] + elrsByArcrole[XbrlConst.notAll]
+        ):
+            if cubes := self.getHypercubes(elrUri):
+                dimensions[elrUri] = cubes
 
         self.cntlr.addToLog("Processing dimension defaults")
-        self.taxonomyJson["dimensions"]["_defaults"] = self.getDimensionDefaults()
+        dimensions["_defaults"] = self.getDimensionDefaults()
+
+    def getHypercubes(self, elrUri: str) -> dict[QName, dict[str, Any]]:
+        relSet = self._relSet((XbrlConst.all, XbrlConst.notAll), elrUri)
+        cubes: dict[QName, dict[str, Any]] = {}
+        for root_concept in relSet.rootConcepts:
+            for rel in relSet.fromModelObject(root_concept):
+                concept: ModelConcept = rel.toModelObject
+                if concept.isHypercubeItem:
+                    cube = {
+                        "primaryItems": self.getPrimaryItems(
+                            rel.consecutiveLinkrole, root_concept
+                        ),
+                        "xbrldt:contextElement": rel.contextElement,
+                        "xbrldt:closed": rel.isClosed,
+                    }
+                    explicitDimensions: dict[QName, list[QName]] = {}
+                    typedDimensions: list[QName] = []
+                    for dimension, consecutiveElr in self.getDimensions(
+                        rel.consecutiveLinkrole, concept, rel.isClosed
+                    ):
+                        if dimension.isExplicitDimension:
+                            explicitDimensions[dimension.qname] = (
+                                self.getDomainMembersForExplicitDimension(
+                                    dimension, consecutiveElr
+                                )
+                            )
+                        elif dimension.isTypedDimension:
+                            typedDimensions.append(dimension.qname)
+                    if explicitDimensions:
+                        cube["explicitDimensions"] = explicitDimensions
+                    if typedDimensions:
+                        cube["typedDimensions"] = typedDimensions
+                    cubes[concept.qname] = cube
+                else:
+                    raise ArelleRelatedException(
+                        f"Found a {concept} but expected a hypercube."
+                    )
+        return cubes
 
     def extractPresentation(self) -> None:
         self.cntlr.addToLog("Processing presentation network")
-        for arcroleUri, elrUri, linkqname, arcqname in self.modelXbrl.baseSets.keys():
-            # cntlr.addToLog(f"{arcroleUri}, {elrUri}, {linkqname}, {arcqname}")
-            if linkqname is None or arcqname is None:
-                continue
-            if arcroleUri == XbrlConst.parentChild and elrUri is not None:
-                self.cntlr.addToLog(f"Processing {elrUri}")
-                self.taxonomyJson["presentation"][elrUri] = {
-                    "labels": {
-                        "en": self.modelXbrl.roleTypeDefinition(elrUri, lang="en")
-                    },
-                }
-                relSet = self.modelXbrl.relationshipSet(XbrlConst.parentChild, elrUri)
-                roots = relSet.rootConcepts
-                match len(roots):
-                    case 0:
-                        self.cntlr.addToLog(
-                            f"WARNING: {elrUri} presentation is empty",
-                            level=logging.WARNING,
-                        )
-                    case 1:
-                        pass
-                    case _:
-                        self.cntlr.addToLog(
-                            f"WARNING: {elrUri} has multiple ({len(roots)}) roots. Presentation order will be arbitrary. Roots: [{', '.join(str(root.qname) for root in roots)}]",
-                            level=logging.WARNING,
-                        )
-                rows: list[tuple[int, QName, bool | None]] = []
-                for root in roots:
-                    rows.append((0, root.qname, None))
-                    self.walkChildren(root, relSet, rows, 1)
-                self.taxonomyJson["presentation"][elrUri]["rows"] = [
-                    (i, qname) for i, qname, _ in rows
-                ]
+        # Each ELR is independent but Arelle's model (and our relationship set
+        # cache) fill lazily on first access so the ELRs are walked serially.
+        presentation: dict[str, dict] = {}
+        self.taxonomyJson["presentation"] = presentation
+        for elrUri in dict.fromkeys(self._elrsByArcrole[XbrlConst.parentChild]):
+            presentation[elrUri] = self.getPresentation(elrUri)
+        self.cntlr.addToLog(f"Processed {len(presentation)} presentation ELRs")
+
+    def getPresentation(self, elrUri: str) -> dict[str, Any]:
+        if self._logEachElr:
+            self.cntlr.addToLog(f"Processing {elrUri}", level=logging.DEBUG)
+        relSet = self._relSet(XbrlConst.parentChild, elrUri)
+        roots = relSet.rootConcepts
+        match len(roots):
+            case 0:
+                self.cntlr.addToLog(
+                    f"WARNING: {elrUri} presentation is empty",
+                    level=logging.WARNING,
+                )
+            case 1:
+                pass
+            case _:
+                self.cntlr.addToLog(
+                    f"WARNING: {elrUri} has multiple ({len(roots)}) roots. Presentation order will be arbitrary. Roots: [{', '.join(str(root.qname) for root in roots)}]",
+                    level=logging.WARNING,
+                )
+        rows: list[tuple[int, QName]] = []
+        for root in roots:
+            rows.append((0, root.qname))
+            self.walkChildren(root, relSet, rows, 1)
+        return {
+            "labels": {"en": self.modelXbrl.roleTypeDefinition(elrUri, lang="en")},
+            "rows": rows,
+        }
 
 
 def runTaxonomyInfo(
@@ -0,0 +1,39 @@
+import os
+import stat
+from argparse import ArgumentParser
+from glob import iglob
+from pathlib import Path
+from typing import Iterable
+
+
+def getListofPathsFromListOfGlobs(globs: list[str]) -> list[str]:
+    return [
+        glob_result for glob_candidate in globs for glob_result in iglob(glob_candidate)
+    ]
+
+
+def checkTaxonomyPackages(paths: Iterable[str | Path]) -> list[str]:
+    """Check each path is an existing .zip file using a single stat() per path.
+    Returns a description of each problem found."""
+    errors: list[str] = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            errors.append(f"missing: {path}")
+            continue
+        if not stat.S_ISREG(st.st_mode):
+            errors.append(f"not a file: {path}")
+        if not str(path).endswith(".zip"):
+            errors.append(f"not a Zip file: {path}")
+    return errors
+
+
+def validateTaxonomyPackages(globList: list[str], parser: ArgumentParser) -> list[str]:
+    print("Zip files specified", " ".join(globList))
+    taxonomy_zips: list[str] = getListofPathsFromListOfGlobs(globList)
+    print("Zip files to use  ", " ".join(taxonomy_zips))
+
+    if errors := checkTaxonomyPackages(taxonomy_zips):
+        raise parser.error("Invalid taxonomy packages:\n\t" + "\n\t".join(errors))
+    return taxonomy_zips
@@ -0,0 +1,231 @@
+import argparse
+import hashlib
+import json
+import shutil
+import socket
+import time
+from collections.abc import Sequence
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from mireport.arelle.daemon import DaemonResult
+    from mireport.conversionresults import Message
+
+
+def createArgParser() -> argparse.ArgumentParser:
+    argparser = argparse.ArgumentParser(
+        description="Check a report package is valid and create a viewer for it including any validation messages."
+    )
+    argparser.add_argument(
+        "report_path",
+        type=Path,
+        help="Path to the report package to be checked.",
+    )
+    argparser.add_argument(
+        "--taxonomy_packages",
+        type=str,
+        nargs="+",
+        default=[],
+        help="Paths to the taxonomy packages to be used (globs, *.zip, are permitted).",
+    )
+    argparser.add_argument(
+        "--viewer-path",
+        type=Path,
+        default=None,
+        help="The path of the viewer to be created.",
+    )
+    argparser.add_argument(
+        "--ignore-calculation-warnings",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Ignore calculation warnings when validating the report package.",
+    )
+    argparser.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Reuse the viewer and messages from an earlier identical offline run.",
+    )
+    return argparser
+
+
+def parseArgs(parser: argparse.ArgumentParser) -> argparse.Namespace:
+    args = parser.parse_args()
+    # Deferred so that --help and usage errors don't pay for importing mireport.
+    from mireport.cli import validateTaxonomyPackages
+
+    if args.taxonomy_packages:
+        args.taxonomy_packages = sorted(
+            (Path(t) for t in validateTaxonomyPackages(args.taxonomy_packages, parser)),
+            key=lambda p: p.name,
+        )
+    return args
+
+
+def _getViewerCacheKey(
+    reportPath: Path, taxonomyPackages: list[Path], disableCalculationValidation: bool
+) -> str:
+    digest = hashlib.blake2b(reportPath.read_bytes(), digest_size=16)
+    for package in taxonomyPackages:
+        stat = package.stat()
+        digest.update(
+            f"\0{package.resolve()}\0{stat.st_size}\0{stat.st_mtime_ns}".encode()
+        )
+    for distribution in ("arelle-release", "ixbrl-viewer"):
+        try:
+            digest.update(f"\0{version(distribution)}".encode())
+        except PackageNotFoundError:
+            pass
+    digest.update(f"\0{disableCalculationValidation}".encode())
+    return digest.hexdigest()
+
+
+def _getViewerCachePaths(key: str) -> tuple[Path, Path]:
+    from mireport import _getCacheDir
+
+    cacheDir = _getCacheDir()
+    return cacheDir / f"viewer-{key}.html", cacheDir / f"viewer-{key}.json"
+
+
+def _loadCachedViewer(key: str, viewerPath: Path) -> Optional[dict]:
+    viewerCache, resultCache = _getViewerCachePaths(key)
+    try:
+        cached = json.loads(resultCache.read_bytes())
+        shutil.copyfile(viewerCache, viewerPath)
+    except (OSError, ValueError):
+        return None
+    return cached
+
+
+def _saveCachedViewer(
+    key: str,
+    viewerPath: Path,
+    messages: Sequence["Message"],
+    logLines: Sequence[str],
+) -> None:
+    viewerCache, resultCache = _getViewerCachePaths(key)
+    try:
+        viewerCache.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(viewerPath, viewerCache)
+        # Written last, and atomically, as its presence marks a usable entry.
+        tmpPath = resultCache.with_suffix(".tmp")
+        tmpPath.write_text(
+            json.dumps({"m": [m.toDict() for m in messages], "l": list(logLines)})
+        )
+        tmpPath.replace(resultCache)
+    except OSError as e:
+        print(f"Unable to cache viewer in {viewerCache.parent}: {e}")
+
+
+def _requestFromDaemon(request: dict) -> Optional["DaemonResult"]:
+    """Hand the request to a running mireport daemon if there is one. The
+    daemon module is only imported where unix domain sockets exist."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    from mireport.arelle.daemon import getSocketPath, requestFromDaemon
+
+    if (result := requestFromDaemon(request)) is not None:
+        print(f"Called into Arelle via the mireport daemon ({getSocketPath()})")
+    return result
+
+
+def main() -> None:
+    start = time.perf_counter_ns()
+
+    args = parseArgs(createArgParser())
+    from mireport.conversionresults import ConversionResultsBuilder
+
+    report_path: Path = args.report_path
+    taxonomy_packages: list[Path] = args.taxonomy_packages
+    viewer_path: Path = args.viewer_path
+
+    if taxonomy_packages:
+        workOffline = True
+        print("Taxonomy packages specified so working OFFLINE.")
+    else:
+        print("No taxonomy packages specified so working ONLINE.")
+        workOffline = False
+
+    if not report_path.is_file():
+        raise SystemExit(f"Report path {report_path} cannot be found.")
+
+    start = time.perf_counter_ns()
+    if viewer_path and viewer_path.is_file():
+        print(f"Overwriting {viewer_path}.")
+
+    # Online runs can pick up different taxonomy content so are never cached.
+    cache_key = None
+    if args.cache and viewer_path and workOffline:
+        cache_key = _getViewerCacheKey(
+            report_path, taxonomy_packages, args.ignore_calculation_warnings
+        )
+
+    if cache_key and (cached := _loadCachedViewer(cache_key, viewer_path)):
+        print("Reusing the result of an earlier identical run (see --no-cache).")
+        from mireport.conversionresults import Message
+
+        messages: Sequence[Message] = Message.fromDictList(cached["m"])
+        log_lines = cached["l"]
+    elif (
+        daemon_result := _requestFromDaemon(
+            {
+                "reportPath": str(report_path.resolve()),
+                "taxonomyPackages": [str(t.resolve()) for t in taxonomy_packages],
+                "workOffline": workOffline,
+                "viewerPath": str(viewer_path.resolve()) if viewer_path else None,
+                "disableCalculationValidation": args.ignore_calculation_warnings,
+            }
+        )
+    ) is not None:
+        messages, log_lines = daemon_result.messages, daemon_result.logLines
+    else:
+        print("Calling into Arelle")
+        from mireport.arelle.report_info import (
+            ArelleReportProcessor,
+            getOrCreateReportPackage,
+        )
+        from mireport.filesupport import copyFileLike
+
+        a = ArelleReportProcessor(
+            taxonomyPackages=taxonomy_packages, workOffline=workOffline
+        )
+        source = getOrCreateReportPackage(report_path)
+
+        if not viewer_path:
+            arelle_result = a.validateReportPackage(
+                source, disableCalculationValidation=args.ignore_calculation_warnings
+            )
+        else:
+            arelle_result = a.validateAndGenerateViewer(
+                source, disableCalculationValidation=args.ignore_calculation_warnings
+            )
+            with open(viewer_path, "wb") as out:
+                copyFileLike(arelle_result.viewer.fileLike(), out)
+        messages, log_lines = arelle_result.messages, arelle_result.logLines
+    if cache_key and not cached:
+        _saveCachedViewer(cache_key, viewer_path, messages, log_lines)
+    if log_lines:
+        print("\t", end="")
+        print(*log_lines, sep="\n\t")
+    elapsed = (time.perf_counter_ns() - start) / 1_000_000_000
+    print(f"Finished querying Arelle ({elapsed:,.2f} seconds elapsed).")
+
+    results = ConversionResultsBuilder()
+    results.addMessages(messages)
+    if results.hasErrorsOrWarnings():
+        if results.hasErrors():
+            print("The report package has errors.")
+        else:
+            print("The report package has warnings.")
+        print("Issues:")
+        for message in results.userMessages:
+            print(f"\t{message}")
+        raise SystemExit(
+            "The report package has errors or warnings. Please check the output above."
+        )
+    else:
+        print("The report package is valid and has no errors or warnings.")
+        if viewer_path:
+            print(f"Viewer written to {viewer_path}.")
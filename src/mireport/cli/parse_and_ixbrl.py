@@ -0,0 +1,162 @@
+import argparse
+import logging
+from typing import TYPE_CHECKING
+
+import rich.traceback
+from rich.logging import RichHandler
+
+# The mireport (and especially Arelle) imports are deferred until after the
+# arguments have been parsed so that --help and usage errors are quick.
+if TYPE_CHECKING:
+    from mireport.conversionresults import ConversionResults
+    from mireport.excelprocessor import ExcelProcessor
+
+
+def createArgParser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Extract facts from Excel and generate HTML."
+    )
+    parser.add_argument("excel_file", help="Path to the Excel file")
+    parser.add_argument("output_file", help="Path to save the generated HTML file")
+    parser.add_argument(
+        "--devinfo",
+        action=argparse.BooleanOptionalAction,
+        help="Enable display of developer information issues (not normally visible to users)",
+    )
+    parser.add_argument(
+        "--taxonomy-packages",
+        type=str,
+        nargs="+",
+        default=[],
+        help="Paths to the taxonomy packages to be used (globs, *.zip, are permitted).",
+    )
+    parser.add_argument(
+        "--offline",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="All work is done offline. Default is to work online, that is --no-offline ",
+    )
+    parser.add_argument(
+        "--skip-validation",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Disables XBRL validation. Useful during development only.",
+    )
+
+    return parser
+
+
+def parseArgs(parser: argparse.ArgumentParser) -> argparse.Namespace:
+    args = parser.parse_args()
+    from mireport.cli import validateTaxonomyPackages
+
+    if args.offline and not args.taxonomy_packages:
+        parser.error(
+            "You need to specify --taxonomy-packages if you want to work offline"
+        )
+    if args.taxonomy_packages:
+        args.taxonomy_packages = validateTaxonomyPackages(
+            args.taxonomy_packages, parser
+        )
+
+    return args
+
+
+def doConversion(
+    args: argparse.Namespace,
+) -> tuple["ConversionResults", "ExcelProcessor"]:
+    import mireport
+    import mireport.taxonomy
+    from mireport.conversionresults import ConversionResultsBuilder
+    from mireport.excelprocessor import VSME_DEFAULTS, ExcelProcessor
+
+    # Progress is already printed as it happens; only --devinfo lists it again.
+    resultsBuilder = ConversionResultsBuilder(
+        consoleOutput=True, captureProgress=bool(args.devinfo)
+    )
+    with resultsBuilder.processingContext(
+        "mireport Excel to validated Inline Report"
+    ) as pc:
+        pc.mark("Loading taxonomy metadata")
+        mireport.loadMetaData()
+        pc.addDevInfoMessage(
+            f"Taxonomies available: {', '.join(mireport.taxonomy.listTaxonomies())}"
+        )
+        pc.mark(
+            "Extracting data from Excel",
+            additionalInfo=f"Using file: {args.excel_file}",
+        )
+        excel = ExcelProcessor(args.excel_file, resultsBuilder, VSME_DEFAULTS)
+        report = excel.populateReport()
+        pc.mark(
+            "Generating Inline Report",
+            additionalInfo=f"Writing to {args.output_file} ({report.factCount} facts to include)",
+        )
+        report.saveInlineReport(args.output_file)
+        if not args.skip_validation:
+            from mireport.arelle.report_info import (
+                ARELLE_VERSION_INFORMATION,
+                ArelleReportProcessor,
+            )
+
+            pc.mark(
+                "Validating using Arelle",
+                additionalInfo=f"({ARELLE_VERSION_INFORMATION})",
+            )
+            arelleResults = ArelleReportProcessor(
+                taxonomyPackages=args.taxonomy_packages,
+                workOffline=args.offline,
+            ).validateReportPackage(
+                report.getInlineReportPackage(),
+            )
+            resultsBuilder.addMessages(arelleResults.messages)
+    return resultsBuilder.build(), excel
+
+
+def outputMessages(
+    args: argparse.Namespace, result: "ConversionResults", excel: "ExcelProcessor"
+) -> None:
+    hasMessages = result.hasMessages(userOnly=True)
+    messages = result.userMessages
+    if args.devinfo:
+        hasMessages = result.hasMessages()
+        messages = result.developerMessages
+
+    if hasMessages:
+        print()
+        print(f"Information and issues encountered ({len(result)} messages):")
+        for message in messages:
+            print(f"\t{message}")
+
+    if args.devinfo and excel.unusedNames:
+        max_output = 40
+        unused = excel.unusedNames
+        if (num := len(unused)) > max_output:
+            size = int(max_output / 2)
+            unused = (
+                unused[:size]
+                + [f"... supressed {num - max_output} rows..."]
+                + unused[-size:]
+            )
+
+        print(
+            f"Unused names ({num}) from Excel workbook:",
+            *unused,
+            sep="\n\t",
+        )
+    return
+
+
+def main() -> None:
+    rich.traceback.install()
+    logging.basicConfig(
+        format="%(message)s",
+        datefmt="[%Y-%m-%d %H:%M:%S]",
+        handlers=[RichHandler(rich_tracebacks=True)],
+    )
+    logging.captureWarnings(True)
+    parser = createArgParser()
+    args = parseArgs(parser)
+    result, excel = doConversion(args)
+    outputMessages(args, result, excel)
+    return
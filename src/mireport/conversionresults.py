@@ -1,5 +1,5 @@
-import uuid
-from collections.abc import Iterable
+import os
+from collections.abc import Collection, Iterable, Iterator
 from enum import StrEnum
 from functools import cache
 from time import perf_counter_ns
@@ -11,19 +11,25 @@ from mireport.taxonomy import Concept
 from mireport.xml import QName
 
 
+def _newConversionId() -> str:
+    """A random (version 4) UUID string without building a uuid.UUID."""
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40
+    b[8] = (b[8] & 0x3F) | 0x80
+    return f"{b[:4].hex()}-{b[4:6].hex()}-{b[6:8].hex()}-{b[8:10].hex()}-{b[10:].hex()}"
+
+
 def format_time_ns(ns: int) -> str:
     """Formats nanoseconds into microseconds, milliseconds, or seconds."""
-    match ns:
-        case ns if ns < 1_000:  # Less than a microsecond
-            return f"{ns} ns"
-        case ns if ns < 1_000_000:  # Less than a millisecond
-            return f"{ns // 1_000} µs"
-        case ns if ns < 1_000_000_000:  # Less than a second
-            return f"{ns // 1_000_000} ms"
-        case _:  # One second or more
-            # Switch to floating point division as people care a bit more about
-            # the decimals at this granularity.
-            return f"{ns / 1_000_000_000:.1f} s"
+    if ns < 1_000:  # Less than a microsecond
+        return f"{ns} ns"
+    if ns < 1_000_000:  # Less than a millisecond
+        return f"{ns // 1_000} µs"
+    if ns < 1_000_000_000:  # Less than a second
+        return f"{ns // 1_000_000} ms"
+    # One second or more. Switch to floating point division as people care a
+    # bit more about the decimals at this granularity.
+    return f"{ns / 1_000_000_000:.1f} s"
 
 
 class Severity(StrEnum):
@@ -36,10 +42,9 @@ class Severity(StrEnum):
         return set(cls.__members__.values())
 
     @classmethod
+    @cache
     def maxValueWidth(cls) -> int:
-        all = cls.all()
-        widths = [len(v.value) for v in all]
-        return max(widths)
+        return max(len(v.value) for v in cls)
 
     @classmethod
     @cache
@@ -68,13 +73,40 @@ class MessageType(StrEnum):
         return wanted
 
     @classmethod
+    @cache
     def maxValueWidth(cls) -> int:
-        all = cls.all()
-        widths = [len(v.value) for v in all]
-        return max(widths)
+        return max(len(v.value) for v in cls)
+
+
+_ALL_SEVERITIES: frozenset[Severity] = frozenset(Severity)
+_ALL_MTYPES: frozenset[MessageType] = frozenset(MessageType)
+# What the user sees: everything except the developer and progress chatter.
+_USER_MTYPES: frozenset[MessageType] = _ALL_MTYPES - {
+    MessageType.DevInfo,
+    MessageType.Progress,
+}
+_ERR_OR_WARN: frozenset[Severity] = frozenset({Severity.ERROR, Severity.WARNING})
+_CONVERSION_MTYPES: frozenset[MessageType] = frozenset(
+    {MessageType.Conversion, MessageType.ExcelParsing}
+)
+
+# Used for every Message.__str__ so build the padded prefix template once.
+_MSG_PREFIX = f"{{:<{Severity.maxValueWidth()}s}}: {{:<{MessageType.maxValueWidth()}s}}"
+# Plain dicts for Message.fromDict; Enum[name] goes through the metaclass.
+_SEV_BY_NAME: dict[str, Severity] = dict(Severity.__members__)
+_MT_BY_NAME: dict[str, MessageType] = dict(MessageType.__members__)
 
 
 class Message:
+    # There can be tens of thousands of these (one per Arelle log record).
+    __slots__ = (
+        "messageText",
+        "severity",
+        "messageType",
+        "conceptQName",
+        "excelReference",
+    )
+
     def __init__(
         self,
         messageText: str,
@@ -91,9 +123,9 @@ class Message:
 
     def __str__(self) -> str:
         bits = [
-            f"{self.severity.value:{Severity.maxValueWidth()}s}: {self.messageType.value:{MessageType.maxValueWidth()}s}"
+            _MSG_PREFIX.format(self.severity.value, self.messageType.value),
+            self.messageText,
         ]
-        bits.append(self.messageText)
         if self.excelReference is not None:
             bits.append(f"(Excel: {self.excelReference})")
         if self.conceptQName is not None:
@@ -104,12 +136,21 @@ class Message:
     @classmethod
     def fromDict(cls, stuff: dict) -> Self:
         m = stuff["m"]
-        s = Severity[stuff["s"]]
-        mt = MessageType[stuff["mt"]]
+        s = _SEV_BY_NAME[stuff["s"]]
+        mt = _MT_BY_NAME[stuff["mt"]]
         c = stuff["c"]
         e = stuff["e"]
         return cls(m, s, mt, c, e)
 
+    @classmethod
+    def fromDictList(cls, stuffList: Iterable[dict]) -> list[Self]:
+        sevByName = _SEV_BY_NAME
+        mtByName = _MT_BY_NAME
+        return [
+            cls(s["m"], sevByName[s["s"]], mtByName[s["mt"]], s["c"], s["e"])
+            for s in stuffList
+        ]
+
     def toDict(self) -> dict:
         d = {
             "m": self.messageText,
@@ -122,6 +163,14 @@ class Message:
 
 
 class ConversionResults:
+    __slots__ = (
+        "conversionId",
+        "messages",
+        "cellsQueried",
+        "cellsPopulated",
+        "_conversionSuccessful",
+    )
+
     def __init__(
         self,
         conversionId: str,
@@ -139,7 +188,7 @@ class ConversionResults:
     @classmethod
     def fromDict(cls, stuff: dict) -> Self:
         id = stuff["id"]
-        m = [Message.fromDict(m) for m in stuff["m"]]
+        m = Message.fromDictList(stuff["m"])
         q = stuff["q"]
         p = stuff["p"]
         success = stuff["success"]
@@ -158,32 +207,45 @@ class ConversionResults:
     def __len__(self) -> int:
         return len(self.messages)
 
+    # The has*() checks scan self.messages directly and stop at the first
+    # hit rather than building the userMessages list first.
+
     def hasErrors(self) -> bool:
-        return any(m.severity is Severity.ERROR for m in self.userMessages)
+        error = Severity.ERROR
+        user = _USER_MTYPES
+        return any(m.severity is error and m.messageType in user for m in self.messages)
 
     def hasErrorsOrWarnings(self) -> bool:
+        errorOrWarning = _ERR_OR_WARN
+        user = _USER_MTYPES
         return any(
-            m.severity in {Severity.ERROR, Severity.WARNING} for m in self.userMessages
+            m.severity in errorOrWarning and m.messageType in user
+            for m in self.messages
         )
 
     def hasMessages(self, userOnly: bool = False) -> bool:
         if userOnly:
-            return bool(self.userMessages)
+            user = _USER_MTYPES
+            return any(m.messageType in user for m in self.messages)
         return bool(self.messages)
 
     def getMessages(
         self,
         *,
-        wantedMessageTypes: set[MessageType] = MessageType.all(),
-        wantedMessageSeverities: set[Severity] = Severity.all(),
+        wantedMessageTypes: Collection[MessageType] = _ALL_MTYPES,
+        wantedMessageSeverities: Collection[Severity] = _ALL_SEVERITIES,
     ) -> list[Message]:
-        messages = [
+        if (
+            wantedMessageTypes is _ALL_MTYPES
+            and wantedMessageSeverities is _ALL_SEVERITIES
+        ):
+            return list(self.messages)
+        return [
             m
             for m in self.messages
             if m.severity in wantedMessageSeverities
             and m.messageType in wantedMessageTypes
         ]
-        return messages
 
     @property
     def developerMessages(self) -> list[Message]:
@@ -191,12 +253,7 @@ class ConversionResults:
 
     @property
     def userMessages(self) -> list[Message]:
-        return self.getMessages(
-            wantedMessageTypes=MessageType.allExcept(
-                MessageType.DevInfo, MessageType.Progress
-            ),
-            wantedMessageSeverities=Severity.all(),
-        )
+        return self.getMessages(wantedMessageTypes=_USER_MTYPES)
 
     @property
     def numCellQueries(self) -> int:
@@ -219,23 +276,54 @@ class ConversionResults:
 
 
 class ConversionResultsBuilder(ConversionResults):
+    # Only the builder's own state; the rest is declared on ConversionResults.
+    __slots__ = (
+        "cellsQueriedBuilder",
+        "cellsPopulatedBuilder",
+        "consoleOutput",
+        "captureProgress",
+        "_sheetIds",
+        "_conceptStrs",
+    )
+
     def __init__(
-        self, conversionId: Optional[str] = None, consoleOutput: bool = False
+        self,
+        conversionId: Optional[str] = None,
+        consoleOutput: bool = False,
+        captureProgress: bool = True,
     ) -> None:
         if conversionId is not None:
             self.conversionId = conversionId
         else:
-            self.conversionId = str(uuid.uuid4())
+            self.conversionId = _newConversionId()
         self.messages: list[Message] = list()
-        self.cellsQueriedBuilder: set[tuple[str, int, int]] = set()
-        self.cellsPopulatedBuilder: set[tuple[str, int, int]] = set()
+        # Cells are only ever counted so each (sheet, row, column) is stored
+        # as a single int: see _packCells.
+        self.cellsQueriedBuilder: set[int] = set()
+        self.cellsPopulatedBuilder: set[int] = set()
         self.consoleOutput = consoleOutput
+        # Progress messages are only shown to developers so callers that never
+        # show them can skip creating them.
+        self.captureProgress = captureProgress
+        self._sheetIds: dict[str, int] = {}
+        # Keyed on the object rather than id() so a recycled id can't return
+        # another concept's name. Concept and QName both hash their QName.
+        self._conceptStrs: dict[QName | Concept, str] = {}
+
+    def _packCells(self, cells: Iterable[tuple[str, int, int]]) -> Iterator[int]:
+        """Packs (sheet, row, column) as sheetId:16 | row:24 | column:24. Excel
+        tops out at 2**20 rows and 2**14 columns so nothing collides."""
+        sheetIds = self._sheetIds
+        for sheet, row, column in cells:
+            if (sheetId := sheetIds.get(sheet)) is None:
+                sheetId = sheetIds[sheet] = len(sheetIds)
+            yield (sheetId << 48) | (row << 24) | column
 
     def addCellQueries(self, delta: Iterable[tuple[str, int, int]]) -> None:
-        self.cellsQueriedBuilder.update(delta)
+        self.cellsQueriedBuilder.update(self._packCells(delta))
 
     def addCellsWithData(self, delta: Iterable[tuple[str, int, int]]) -> None:
-        self.cellsPopulatedBuilder.update(delta)
+        self.cellsPopulatedBuilder.update(self._packCells(delta))
 
     @property
     def numCellQueries(self) -> int:
@@ -257,8 +345,10 @@ class ConversionResultsBuilder(ConversionResults):
         concept_str_or_none: Optional[str]
         if taxonomy_concept is None:
             concept_str_or_none = taxonomy_concept
-        else:
-            concept_str_or_none = str(taxonomy_concept)
+        elif (concept_str_or_none := self._conceptStrs.get(taxonomy_concept)) is None:
+            concept_str_or_none = self._conceptStrs[taxonomy_concept] = str(
+                taxonomy_concept
+            )
         self.messages.append(
             Message(
                 message_text,
@@ -277,13 +367,12 @@ class ConversionResultsBuilder(ConversionResults):
 
     @property
     def conversionSuccessful(self) -> bool:
-        bad = bool(
-            self.getMessages(
-                wantedMessageSeverities={Severity.ERROR, Severity.WARNING},
-                wantedMessageTypes={MessageType.Conversion, MessageType.ExcelParsing},
-            )
+        errorOrWarning = _ERR_OR_WARN
+        conversion = _CONVERSION_MTYPES
+        return not any(
+            m.severity in errorOrWarning and m.messageType in conversion
+            for m in self.messages
         )
-        return not bad
 
     def build(self) -> ConversionResults:
         return ConversionResults(
@@ -304,6 +393,7 @@ class ProcessingContext:
         self.current_section_start_time: int
         self.current_section_name: Optional[str] = None
         self.console = self._resultsBuilder.consoleOutput
+        self.capture = self._resultsBuilder.captureProgress
 
     def __enter__(self) -> Self:
         self.start_time = self.current_section_start_time = perf_counter_ns()
@@ -341,7 +431,8 @@ class ProcessingContext:
         return swallow_exception
 
     def _logProgress(self, message: str, severity: Severity = Severity.INFO) -> None:
-        self._resultsBuilder.addMessage(message, severity, MessageType.Progress)
+        if self.capture:
+            self._resultsBuilder.addMessage(message, severity, MessageType.Progress)
         if self.console:
             print(message)
 
@@ -352,6 +443,12 @@ class ProcessingContext:
         self, newSectionName: Optional[str] = None, additionalInfo: str = ""
     ) -> None:
         now = perf_counter_ns()
+        if not (self.capture or self.console):
+            # Nobody will see the progress so only keep track of the section.
+            if newSectionName is not None:
+                self.current_section_name = newSectionName
+                self.current_section_start_time = now
+            return
         if self.current_section_name is not None:
             execution_time_ns = now - self.current_section_start_time
             self._logProgress(
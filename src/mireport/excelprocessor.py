@@ -6,6 +6,7 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import date, datetime
 from itertools import combinations
+from operator import attrgetter
 from pathlib import Path
 from typing import BinaryIO, NamedTuple, Optional, Self
 
@@ -48,6 +49,10 @@ from mireport.xbrlreport import FactBuilder, InlineReport, _FactValue
 
 L = logging.getLogger(__name__)
 
+# Text in brackets in a unit cell, e.g. "Euro (EUR)". Like r"\((.*?)\)" but
+# without the backtracking.
+_PAREN_UNIT_RE = re.compile(r"\(([^)\n]*)\)")
+
 
 def _loadVsmeDefaults(bits: dict) -> None:
     VSME_DEFAULTS.update(bits)
@@ -152,10 +157,13 @@ class ExcelProcessor:
             CellAndXBRLMetadataHolder, dict[Concept, Concept]
         ] = defaultdict(dict)
         self._tableRelatedNames: dict[CellAndXBRLMetadataHolder, TableXBRLContents] = {}
+        self._conceptsByName: dict[str, Optional[Concept]] = {}
+        self._cellRanges: dict[DefinedName, Optional[CellRangeMetadata]] = {}
 
         # Not yet initialised. Need setting early
         self._workbook: Workbook
         self._report: InlineReport
+        self._definedNamesByName: dict[str, DefinedName]
 
     @property
     def taxonomy(self) -> Taxonomy:
@@ -210,11 +218,13 @@ class ExcelProcessor:
 
     def _loadWorkbook(self) -> None:
         self._workbook = loadExcelFromPathOrFileLike(self._excelPathOrFileLike)
+        # Looked up by name all through processing so take a plain dict copy.
+        self._definedNamesByName = dict(self._workbook.defined_names)
 
     def _recordNamedRanges(self) -> None:
         self._unusedDefinedNames.update(
             dn
-            for dn in self._workbook.defined_names.values()
+            for dn in self._definedNamesByName.values()
             if dn.name and not dn.name.startswith(("enum_", "template_"))
         )
 
@@ -222,9 +232,7 @@ class ExcelProcessor:
         """
         Get the DefinedName for a given name string or None if it is not present.
         """
-        if name in self._workbook.defined_names:
-            return self._workbook.defined_names[name]
-        return None
+        return self._definedNamesByName.get(name)
 
     def _verifyEntryPoint(self) -> None:
         name = self._defaults.get("entryPoint", "")
@@ -257,7 +265,7 @@ class ExcelProcessor:
         }
         if "aoix" in defaults:
             for aoixName, namedRangeName in defaults["aoix"].items():
-                if namedRangeName not in self._workbook.defined_names:
+                if namedRangeName not in self._definedNamesByName:
                     self._results.addMessage(
                         f"Excel report must have a value for named range {namedRangeName}.",
                         Severity.ERROR,
@@ -343,7 +351,7 @@ class ExcelProcessor:
 
         if "report" in defaults:
             entityName_namedRange = defaults["report"]["entity-name"]
-            if entityName_namedRange in self._workbook.defined_names:
+            if entityName_namedRange in self._definedNamesByName:
                 self._report.setEntityName(
                     self.getSingleStringValue(entityName_namedRange)
                 )
@@ -406,7 +414,7 @@ class ExcelProcessor:
         column: int = -1,
     ) -> Optional[_CellType]:
         if isinstance(definedName, str):
-            definedName = self._workbook.defined_names.get(definedName)
+            definedName = self._definedNamesByName.get(definedName)
             if definedName is None:
                 return None
 
@@ -478,38 +486,9 @@ class ExcelProcessor:
             )
             column = cr.min_col
 
-        rows = list(
-            ws.iter_rows(min_row=row, max_row=row, min_col=column, max_col=column)
-        )
-        match len(rows):
-            case 0:
-                return None
-            case 1:
-                cells = rows[0]
-            case _:
-                return None
-
-        match len(cells):
-            case 0:
-                cell = None
-                self._results.addMessage(
-                    "No cells found in row of this named range.",
-                    Severity.ERROR,
-                    MessageType.DevInfo,
-                    excel_reference=excelCellRangeRef(ws, cr),
-                )
-            case 1:
-                cell = cells[0]
-            case _:
-                cell = None
-                self._results.addMessage(
-                    f"More than one cell found in range but only expected one cell. {cells}",
-                    Severity.ERROR,
-                    MessageType.DevInfo,
-                    excel_reference=excelCellRangeRef(ws, cr),
-                )
-
-        if cell is None or cell.value is None:
+        # iter_rows() over a 1x1 range just calls this for the one cell.
+        cell = ws.cell(row=row, column=column)
+        if cell.value is None:
             return None
 
         if cell.value == EXCEL_PLACEHOLDER_VALUE:
@@ -552,7 +531,7 @@ class ExcelProcessor:
             return None
         cellValue = str(cell.value).strip()
         candidates = [cellValue]
-        candidates.extend(re.findall(r"\((.*?)\)", cellValue))
+        candidates.extend(_PAREN_UNIT_RE.findall(cellValue))
         possible_units = [
             unit
             for c in candidates
@@ -591,13 +570,23 @@ class ExcelProcessor:
                 )
                 return None
 
+    def _getConceptForName(self, name: str) -> Optional[Concept]:
+        """Taxonomy.getConceptForName() remembering the answer. The concept and
+        member parts of "Concept_Member" names repeat a lot."""
+        if name in self._conceptsByName:
+            return self._conceptsByName[name]
+        concept = self._conceptsByName[name] = self.taxonomy.getConceptForName(name)
+        return concept
+
     def _processNamedRanges(self) -> None:
-        for dn in sorted(self._unusedDefinedNames, key=lambda d: d.name):
-            concept = self.taxonomy.getConceptForName(dn.name)
+        # Nothing below looks at _unusedDefinedNames so update it once at the end.
+        used: list[DefinedName] = []
+        for dn in sorted(self._unusedDefinedNames, key=attrgetter("name")):
+            concept = self._getConceptForName(dn.name)
 
             # TODO FIXME Temporary fix for the VSME taxonomy
             if dn.name == "IdentifierOfSitesInBiodiversitySensitiveAreasTypedAxis":
-                concept = self.taxonomy.getConceptForName("IdentifierOfSiteTypedAxis")
+                concept = self._getConceptForName("IdentifierOfSiteTypedAxis")
             # TODO FIXME Temporary fix for the VSME taxonomy
 
             if concept is not None:
@@ -607,21 +596,22 @@ class ExcelProcessor:
                             crh, concept=concept
                         )
                     )
+                    used.append(dn)
             elif "_" in dn.name:
                 conceptName, _, memberName = dn.name.partition("_")
                 if "unit" == memberName:
                     if (
-                        concept := self._report.taxonomy.getConceptForName(conceptName)
+                        concept := self._getConceptForName(conceptName)
                     ) is not None and (crh := self._getCellRange(dn)) is not None:
                         self._conceptToUnitHolderMap[concept] = (
                             CellAndXBRLMetadataHolder.fromCellRangeMetadata(
                                 crh, concept
                             )
                         )
-                        self._unusedDefinedNames.remove(dn)
+                        used.append(dn)
                 else:
-                    concept = self._report.taxonomy.getConceptForName(conceptName)
-                    dimValue = self._report.taxonomy.getConceptForName(memberName)
+                    concept = self._getConceptForName(conceptName)
+                    dimValue = self._getConceptForName(memberName)
                     crh = self._getCellRange(dn)
                     if crh is not None and concept is not None and dimValue is not None:
                         b = CellAndXBRLMetadataHolder.fromCellRangeMetadata(
@@ -635,14 +625,14 @@ class ExcelProcessor:
                         ) is not None:
                             self._definedNameToXBRLMap[dn] = b
                             self._presetDimensions[b][dim] = dimValue
+                            used.append(dn)
                         else:
                             self._results.addMessage(
                                 f"Domain member qualification set in named range {dn.name} but no dimension can be found for member.",
                                 Severity.ERROR,
                                 MessageType.DevInfo,
                             )
-            if dn in self._definedNameToXBRLMap:
-                self._unusedDefinedNames.remove(dn)
+        self._unusedDefinedNames.difference_update(used)
         self._results.addMessage(
             f"Excel file parsed ({self._results.numCellsPopulated} cells had data, with {self._results.numCellQueries} cells accessed).",
             Severity.INFO,
@@ -650,6 +640,14 @@ class ExcelProcessor:
         )
 
     def _getCellRange(self, dn: DefinedName) -> Optional[CellRangeMetadata]:
+        """Works out (and remembers) where dn points. Any problems with the
+        range are only reported the first time."""
+        if dn in self._cellRanges:
+            return self._cellRanges[dn]
+        crh = self._cellRanges[dn] = self._readCellRange(dn)
+        return crh
+
+    def _readCellRange(self, dn: DefinedName) -> Optional[CellRangeMetadata]:
         all_destinations = list(dn.destinations)
         match len(all_destinations):
             case 0:
@@ -722,6 +720,19 @@ class ExcelProcessor:
                 MessageType.DevInfo,
             )
 
+        # Only ranges on a table's own worksheet can be part of it, so bucket
+        # the possible parts by worksheet once, along with their bounds.
+        partsByWorksheet: dict[
+            Worksheet,
+            list[tuple[CellAndXBRLMetadataHolder, tuple[int, int, int, int]]],
+        ] = defaultdict(list)
+        for stuff in self._definedNameToXBRLMap.values():
+            concept = stuff.concept
+            if concept.isReportable or concept.isDimension:
+                partsByWorksheet[stuff.worksheet].append(
+                    (stuff, stuff.cellRange.bounds)
+                )
+
         for table, table_stuff in tables:
             tableCr = table_stuff.cellRange
             tableWorksheet = table_stuff.worksheet
@@ -750,18 +761,27 @@ class ExcelProcessor:
 
             candidates: list[CellAndXBRLMetadataHolder] = []
             extras_in_excel: set[CellAndXBRLMetadataHolder] = set()
-            for dn, stuff in self._definedNameToXBRLMap.items():
-                if tableWorksheet is not stuff.worksheet:
-                    continue
-                concept = stuff.concept
-                if not (concept.isReportable or concept.isDimension):
-                    continue
-                if tableCr.issuperset(stuff.cellRange):
-                    if concept in allPermittedConceptsForTable:
+            # Plain integer versions of CellRange.issuperset() / isdisjoint().
+            tMinCol, tMinRow, tMaxCol, tMaxRow = tableCr.bounds
+            for stuff, (minCol, minRow, maxCol, maxRow) in partsByWorksheet.get(
+                tableWorksheet, []
+            ):
+                if (
+                    tMinCol <= minCol
+                    and tMinRow <= minRow
+                    and maxCol <= tMaxCol
+                    and maxRow <= tMaxRow
+                ):
+                    if stuff.concept in allPermittedConceptsForTable:
                         candidates.append(stuff)
                     else:
                         extras_in_excel.add(stuff)
-                elif not tableCr.isdisjoint(stuff.cellRange):
+                elif not (
+                    maxCol < tMinCol
+                    or minCol > tMaxCol
+                    or maxRow < tMinRow
+                    or minRow > tMaxRow
+                ):
                     extras_in_excel.add(stuff)
 
             if extras_in_excel:
@@ -1351,7 +1371,7 @@ class ExcelProcessor:
 
                     dimValueDN: Optional[DefinedName] = None
                     if (
-                        dimValueDN := self._workbook.defined_names.get(
+                        dimValueDN := self._definedNamesByName.get(
                             dimValue.qname.localName
                         )
                     ) is None:
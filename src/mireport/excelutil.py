@@ -1,4 +1,5 @@
 import re
+from collections import defaultdict
 from datetime import date, datetime, time
 from pathlib import Path
 from typing import (
@@ -16,6 +17,7 @@ from openpyxl import Workbook, load_workbook
 from openpyxl.cell import Cell, MergedCell, ReadOnlyCell
 from openpyxl.utils.cell import absolute_coordinate, quote_sheetname
 from openpyxl.workbook.defined_name import DefinedName
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
 from openpyxl.worksheet.cell_range import CellRange
 from openpyxl.worksheet.worksheet import Worksheet
 
@@ -34,9 +36,19 @@ def checkExcelFilePath(path: Path) -> None:
         raise Exception(f'"{path}" is not a supported (.xlsx) Excel file')
 
 
-def loadExcelFromPathOrFileLike(pathOrFile: Path | BinaryIO) -> Workbook:
+def loadExcelFromPathOrFileLike(
+    pathOrFile: Path | BinaryIO, readOnly: bool = False
+) -> Workbook:
+    """Load a workbook with cached (not formula) values.
+
+    readOnly=True streams the sheets and is much lighter but only suits
+    sequential access (e.g. getNamedRanges); the workbook must be closed."""
     wb = load_workbook(
-        filename=pathOrFile, read_only=False, data_only=True, rich_text=True
+        filename=pathOrFile,
+        read_only=readOnly,
+        data_only=True,
+        rich_text=True,
+        keep_links=not readOnly,
     )
     return wb
 
@@ -87,9 +99,16 @@ def excelDefinedNameRef(
 
 
 def getNamedRanges(wb: Workbook) -> dict:
-    data = {}
-    for dn in list(wb.defined_names.values()):
-        sheet_name, cell_range = list(dn.destinations)[0]
+    """Get the values of all the cells covered by each defined name.
+
+    Read-only worksheets re-parse the sheet for every iter_rows() call so each
+    one is streamed once over the rows spanned by its ranges, keeping only the
+    slices that fall inside a wanted range. Normal worksheets have random
+    access so each range is read on its own, which avoids creating the cells
+    in between."""
+    rangesBySheet: dict[str, list[tuple[str, CellRange]]] = defaultdict(list)
+    for dn in wb.defined_names.values():
+        sheet_name, cell_range = next(iter(dn.destinations))
         if not cell_range:
             continue
         cr = CellRange(cell_range)
@@ -102,20 +121,72 @@ def getNamedRanges(wb: Workbook) -> dict:
             raise OpenPyXlRelatedException(
                 f"Cell range bounds expected to be int but actually None {cr=}"
             )
-        width: int = cr.max_col - cr.min_col
-        height: int = cr.max_row - cr.min_row
+        rangesBySheet[sheet_name].append((dn.name, cr))
+
+    data: dict[str, list[_CellValue]] = {}
+    for sheet_name, ranges in rangesBySheet.items():
         ws = wb[sheet_name]
-        if not width and not height:
-            cell = ws[cell_range]
-            cells = [cell.value]
-        else:
-            cells = []
-            for row in ws[cell_range]:
-                cells.extend([c.value for c in row])
-        data[dn.name] = cells
+        if isinstance(ws, ReadOnlyWorksheet):
+            data.update(_sweepNamedRanges(ws, ranges))
+            continue
+        for name, cr in ranges:
+            cells: list[_CellValue] = []
+            for row in ws.iter_rows(
+                min_row=cr.min_row,
+                max_row=cr.max_row,
+                min_col=cr.min_col,
+                max_col=cr.max_col,
+                values_only=True,
+            ):
+                cells.extend(row)
+            data[name] = cells
     return data
 
 
+def _sweepNamedRanges(
+    ws: ReadOnlyWorksheet, ranges: list[tuple[str, CellRange]]
+) -> dict[str, list[_CellValue]]:
+    """One pass over the rows of ws spanned by ranges. Only the ranges covering
+    the current row are looked at and only their cells are kept."""
+    min_col = min(cr.min_col for _, cr in ranges)
+    pending = sorted(ranges, key=lambda r: r[1].min_row, reverse=True)
+    cellsByName: dict[str, list[_CellValue]] = {name: [] for name, _ in ranges}
+    active: list[tuple[list[_CellValue], int, int, int]] = []
+    rows = ws.iter_rows(
+        min_row=pending[-1][1].min_row,
+        max_row=max(cr.max_row for _, cr in ranges),
+        min_col=min_col,
+        max_col=max(cr.max_col for _, cr in ranges),
+        values_only=True,
+    )
+    for rowNumber, row in enumerate(rows, start=pending[-1][1].min_row):
+        while pending and pending[-1][1].min_row <= rowNumber:
+            name, cr = pending.pop()
+            active.append(
+                (
+                    cellsByName[name],
+                    cr.min_col - min_col,
+                    cr.max_col - min_col + 1,
+                    cr.max_row,
+                )
+            )
+        for cells, start, stop, _ in active:
+            part = row[start:stop]
+            cells.extend(part)
+            if len(part) < stop - start:
+                cells.extend([None] * (stop - start - len(part)))
+        active = [a for a in active if a[3] > rowNumber]
+        if not (active or pending):
+            break
+
+    # The sheet can end before a range does; those cells are empty.
+    for name, cr in ranges:
+        cells = cellsByName[name]
+        if len(cells) < (expected := cr.size["rows"] * cr.size["columns"]):
+            cells.extend([None] * (expected - len(cells)))
+    return cellsByName
+
+
 def get_decimal_places(cell: _CellType) -> int:
     """
     Returns the number of decimal places in the cell's number format.
@@ -1,10 +1,15 @@
+import os
 import re
+import shutil
 from io import BytesIO
-from typing import NamedTuple
+from pathlib import Path
+from typing import BinaryIO, NamedTuple, Union
 
 ZIP_UNWANTED_RE = re.compile(r"[^\w.]+")  # \w includes '_'
 FILE_UNWANTED_RE = re.compile(r'[<>:"/\\|?*]')
 
+COPY_BUFFER_SIZE = 1024 * 1024
+
 
 def is_valid_filename(filename: str) -> bool:
     """Checks if the filename is valid for Windows."""
@@ -49,3 +54,46 @@ class FilelikeAndFileName(NamedTuple):
 
     def fileLike(self) -> BytesIO:
         return BytesIO(self.fileContent)
+
+
+class FilePathAndFileName(NamedTuple):
+    """As FilelikeAndFileName but the content stays on disk until read, so
+    large files are streamed rather than held in memory."""
+
+    path: Path
+    filename: str
+
+    def fileLike(self) -> BinaryIO:
+        return open(self.path, "rb")
+
+
+AnyFileAndFileName = Union[FilelikeAndFileName, FilePathAndFileName]
+
+
+def copyFileLike(source: BinaryIO, target: BinaryIO) -> None:
+    """Copy the rest of source to target with as few syscalls as possible."""
+    if isinstance(source, BytesIO):
+        # Already in memory: hand the whole buffer to a single write().
+        with source.getbuffer() as buffer:
+            target.write(buffer[source.tell() :])
+        return
+    try:
+        inFd, outFd = source.fileno(), target.fileno()
+        offset, size = source.tell(), os.fstat(inFd).st_size
+    except (AttributeError, OSError):
+        shutil.copyfileobj(source, target, COPY_BUFFER_SIZE)
+        return
+    target.flush()
+    try:
+        while offset < size:
+            # Zero-copy, kernel to kernel. Not all platforms/file types allow it.
+            sent = os.sendfile(outFd, inFd, offset, size - offset)
+            if not sent:
+                break
+            offset += sent
+    except (AttributeError, OSError):
+        pass
+    # sendfile() doesn't move source's position. Whatever it didn't manage to
+    # send (possibly everything) is copied the ordinary way.
+    source.seek(offset)
+    shutil.copyfileobj(source, target, COPY_BUFFER_SIZE)
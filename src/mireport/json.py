@@ -1,9 +1,15 @@
+from functools import cache
 from importlib.abc import Traversable
 from importlib.resources import Package, files
-from json import loads
 from typing import Any, Generator
 
-__all__ = ["getResource", "getObject", "getJsonFiles"]
+try:
+    # orjson is an optional speed-up, several times faster than json.loads.
+    from orjson import loads
+except ImportError:
+    from json import loads  # type: ignore[assignment]
+
+__all__ = ["getResource", "getObject", "getCachedObject", "getJsonFiles", "loads"]
 
 
 def getResource(module: Package, filename: str) -> Traversable:
@@ -14,6 +20,15 @@ def getObject(source: Traversable) -> Any:
     return loads(source.read_bytes())
 
 
+@cache
+def getCachedObject(module: Package, filename: str) -> Any:
+    """Parse a packaged JSON resource once per process.
+
+    The returned object is shared between callers and must be treated as
+    read-only."""
+    return getObject(getResource(module, filename))
+
+
 def getJsonFiles(module: Package) -> Generator[Traversable, None, None]:
     for f in files(module).iterdir():
         if f.is_file() and f.name.endswith(".json"):
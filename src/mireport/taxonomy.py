@@ -7,7 +7,7 @@ import re
 from collections import defaultdict
 from enum import Enum, StrEnum, auto
 from functools import cache, cached_property
-from typing import Any, NamedTuple, Optional, overload
+from typing import Any, Iterator, NamedTuple, Optional, overload
 
 from mireport import data
 from mireport.exceptions import (
@@ -15,7 +15,7 @@ from mireport.exceptions import (
     TaxonomyException,
     UnknownTaxonomyException,
 )
-from mireport.json import getObject, getResource
+from mireport.json import getCachedObject
 from mireport.utr import UTR
 from mireport.xml import (
     ENUM2_NS,
@@ -384,6 +384,14 @@ class PresentationGroup(NamedTuple):
     relationships: list[Relationship]
     style: PresentationStyle
 
+    def iterLabels(
+        self, lang: str = "en"
+    ) -> Iterator[tuple[int, Optional[str], Concept]]:
+        """Yields (depth, standard label, concept) for each relationship in
+        presentation order."""
+        for _, depth, concept in self.relationships:
+            yield depth, concept.getStandardLabel(lang), concept
+
 
 class BaseSet(NamedTuple):
     roleUri: str
@@ -447,7 +455,7 @@ class Taxonomy:
             (k, frozenset(v)) for k, v in cByPretend.items()
         )
 
-        dimensionDefaults: dict[str, str] = dimensions.pop("_defaults", {})
+        dimensionDefaults: dict[str, str] = dimensions.get("_defaults", {})
         self._dimensionDefaults: dict[Concept, Concept] = dict(
             (self.getConcept(dimension), self.getConcept(domainMember))
             for dimension, domainMember in dimensionDefaults.items()
@@ -463,26 +471,26 @@ class Taxonomy:
         domainByDimension: dict[Concept, list[Concept]] = defaultdict(list)
 
         for role, cubes in dimensions.items():
+            if role == "_defaults":
+                continue
             cubeConcepts = frozenset(concepts[c] for c in cubes.keys())
             baseSet = BaseSet(role, cubeConcepts)
             for cubeQname, cubeDetails in cubes.items():
                 hc_concept = concepts[cubeQname]
                 d: dict[str, Any] = {}
 
-                closed = bool(cubeDetails.pop("xbrldt:closed"))
+                closed = bool(cubeDetails["xbrldt:closed"])
                 d["xbrldt:closed"] = closed
                 if not closed:
                     open_hcs.add(Relationship(role, 0, hc_concept))
 
-                container = DimensionContainerType(
-                    cubeDetails.pop("xbrldt:contextElement")
-                )
+                container = DimensionContainerType(cubeDetails["xbrldt:contextElement"])
                 desired_containers.add(container)
                 d["xbrldt:contextElement"] = container
 
                 d["primaryItems"] = [
                     Relationship(role, depth, concepts[qname])
-                    for depth, qname in cubeDetails.pop("primaryItems", [])
+                    for depth, qname in cubeDetails.get("primaryItems", [])
                 ]
                 for r in d["primaryItems"]:
                     self._lookupBaseSetByPrimaryItem[r.concept].append(baseSet)
@@ -491,7 +499,7 @@ class Taxonomy:
                     concepts[dimQname]: frozenset(
                         concepts[member] for member in memberQnameList
                     )
-                    for dimQname, memberQnameList in cubeDetails.pop(
+                    for dimQname, memberQnameList in cubeDetails.get(
                         "explicitDimensions", {}
                     ).items()
                 }
@@ -500,7 +508,7 @@ class Taxonomy:
 
                 d["typedDimensions"] = [
                     concepts[dimQname]
-                    for dimQname in cubeDetails.pop("typedDimensions", [])
+                    for dimQname in cubeDetails.get("typedDimensions", [])
                 ]
 
                 self._lookupBaseSetByCube[hc_concept].append(baseSet)
@@ -785,13 +793,13 @@ def listTaxonomies() -> list[str]:
     return sorted(_TAXONOMIES.keys())
 
 
-def _loadTaxonomyFromFile(bits: dict) -> None:
+def _clearTaxonomies() -> None:
+    _TAXONOMIES.clear()
+
+
+def _buildTaxonomy(bits: dict) -> Taxonomy:
+    """Build a taxonomy from its JSON form without registering it."""
     qnameMaker = getBootsrapQNameMaker()
-    entryPoint = bits["entryPoint"]
-    if _TAXONOMIES.get(entryPoint) is not None:
-        raise TaxonomyException(
-            f"Already loaded taxonomy. Taxonomies loaded: {' '.join(_TAXONOMIES.keys())}"
-        )
     for prefix, namespace in bits["namespaces"].items():
         qnameMaker.addNamespacePrefix(prefix, namespace)
 
@@ -800,13 +808,29 @@ def _loadTaxonomyFromFile(bits: dict) -> None:
         for str_qname, jconcept in bits["concepts"].items()
     }
 
-    _TAXONOMIES[entryPoint] = Taxonomy(
+    taxonomy = Taxonomy(
         concepts,
-        entryPoint=entryPoint,
+        entryPoint=bits["entryPoint"],
         presentation=bits["presentation"],
         dimensions=bits["dimensions"],
         qnameMaker=qnameMaker,
-        utr=UTR.fromDict(
-            getObject(getResource(data, "utr.json")), qnameMaker=qnameMaker
-        ),
+        utr=UTR.fromDict(getCachedObject(data, "utr.json"), qnameMaker=qnameMaker),
     )
+    # Only the taxonomy's (and UTR's) own QNames are worth keeping canonical.
+    qnameMaker.freezeCache()
+    return taxonomy
+
+
+def _registerTaxonomy(taxonomy: Taxonomy) -> None:
+    entryPoint = taxonomy.entryPoint
+    if _TAXONOMIES.get(entryPoint) is not None:
+        raise TaxonomyException(
+            f"Already loaded taxonomy. Taxonomies loaded: {' '.join(_TAXONOMIES.keys())}"
+        )
+    _TAXONOMIES[entryPoint] = taxonomy
+
+
+def _loadTaxonomyFromFile(bits: dict) -> Taxonomy:
+    taxonomy = _buildTaxonomy(bits)
+    _registerTaxonomy(taxonomy)
+    return taxonomy
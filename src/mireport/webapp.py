@@ -24,6 +24,7 @@ from mireport import loadMetaData
 from mireport.arelle.report_info import (
     ARELLE_VERSION_INFORMATION,
     ArelleReportProcessor,
+    startArelleWorkerPool,
 )
 from mireport.conversionresults import (
     ConversionResults,
@@ -140,6 +141,12 @@ def create_app() -> Flask:
             f"Configured to use Arelle offline with {len(taxonomyPackageList)} taxonomy packages: [{', '.join(repr(a) for a in sorted(taxonomyPackageList))}]"
         )
 
+    # Several Arelle processes let conversions run concurrently rather than
+    # queueing on BIG_ARELLE_LOCK.
+    if (workers := int(app.config.get("ARELLE_WORKER_PROCESSES", 0))) > 0:
+        startArelleWorkerPool(workers)
+        L.info(f"Running Arelle in {workers} worker processes")
+
     # Install enumeration classes for use in templates
     app.jinja_env.globals.update(
         {
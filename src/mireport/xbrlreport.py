@@ -1,6 +1,5 @@
 import logging
 import re
-import shutil
 import zipfile
 from abc import ABC
 from collections import defaultdict
@@ -20,7 +19,7 @@ from jinja2 import Environment, PackageLoader
 from markupsafe import Markup, escape
 
 from mireport.exceptions import InlineReportException
-from mireport.filesupport import FilelikeAndFileName, zipSafeString
+from mireport.filesupport import FilelikeAndFileName, copyFileLike, zipSafeString
 from mireport.taxonomy import (
     Concept,
     PresentationGroup,
@@ -863,7 +862,7 @@ class InlineReport:
     def saveInlineReport(self, target: Path) -> None:
         ixbrl_content = self.getInlineReport()
         with open(target, "wb") as out:
-            shutil.copyfileobj(ixbrl_content.fileLike(), out)
+            copyFileLike(ixbrl_content.fileLike(), out)
 
     def _getSafeEntityName(self) -> str:
         safeName = zipSafeString(self._entityName, fallback="Sample")
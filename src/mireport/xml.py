@@ -81,6 +81,15 @@ class NamespaceManager:
         self._prefixToNamespaces[prefix] = namespace
         return prefix
 
+    def __getstate__(self) -> dict[str, str]:
+        return self._prefixToNamespaces
+
+    def __setstate__(self, state: dict[str, str]) -> None:
+        # Unpickled strings are not intern()ed so re-add everything.
+        self.__init__()  # type: ignore[misc]
+        for prefix, namespace in state.items():
+            self.add(prefix, namespace)
+
     def prefixIsKnown(self, prefix: str) -> bool:
         return prefix in self._prefixToNamespaces
 
@@ -105,7 +114,14 @@ class QName:
     ):
         self.namespace = sys.intern(q.namespace)
         self.prefix = sys.intern(q.prefix)
-        self.localName = q.localName
+        self.localName = sys.intern(q.localName)
+
+    def __getstate__(self) -> _QNameTuple:
+        return _QNameTuple(self.prefix, self.localName, self.namespace)
+
+    def __setstate__(self, state: tuple[str, str, str]) -> None:
+        # Unpickled strings are not intern()ed so go through __init__ again.
+        self.__init__(_QNameTuple(*state))  # type: ignore[misc]
 
     def __key(self) -> tuple[str, str, str]:
         # compare on localname first for speed
@@ -138,8 +154,22 @@ class QName:
 
 
 class QNameMaker:
+    """Hands out a single canonical QName per "prefix:localName" so that
+    taxonomies share instances and lookups mostly succeed on identity. Prefix
+    bindings can't be changed once added so the cache never goes stale.
+
+    Once the taxonomy is built the cache is frozen (see freezeCache()) so that
+    names coming from user input, such as unit ids, don't grow it forever."""
+
     def __init__(self, nsManager: NamespaceManager):
         self.nsManager = nsManager
+        self._canonical: dict[str, QName] = {}
+        self._cacheFrozen = False
+
+    def freezeCache(self) -> None:
+        """Stop adding new QNames to the canonical cache. QNames already in it
+        are still shared; new ones are created afresh (and compare equal)."""
+        self._cacheFrozen = True
 
     def _getAndValidateParts(self, /, qname: str) -> _QNameTuple:
         if not (qname and len(parts := qname.split(":", 1)) == 2):
@@ -175,14 +205,23 @@ class QNameMaker:
             return False
 
     def fromString(self, /, qname: str) -> QName:
+        if (existing := self._canonical.get(qname)) is not None:
+            return existing
         q = self._getAndValidateParts(qname)
-        return QName(q)
+        if self._cacheFrozen:
+            return QName(q)
+        return self._canonical.setdefault(qname, QName(q))
 
     def fromNamespaceAndLocalName(self, /, namespace: str, localName: str) -> QName:
         prefix = self.nsManager.getOrGeneratePrefixForNamespace(namespace)
+        key = f"{prefix}:{localName}"
+        if (existing := self._canonical.get(key)) is not None:
+            return existing
         q = _QNameTuple(prefix=prefix, localName=localName, namespace=namespace)
         self._partsValidator(q)
-        return QName(q)
+        if self._cacheFrozen:
+            return QName(q)
+        return self._canonical.setdefault(key, QName(q))
 
     def addNamespacePrefix(self, prefix: str, namespace: str) -> None:
         self.nsManager.add(prefix, namespace)
@@ -53,6 +53,15 @@ def test_processing_context_failure(builder):
     assert any("finished abnormally" in m.messageText for m in msgs)
 
 
+def test_processing_context_without_progress_capture():
+    builder = ConversionResultsBuilder(captureProgress=False)
+    with builder.processingContext("Quiet Test") as ctx:
+        ctx.mark("Step 1")
+        ctx.addDevInfoMessage("Still recorded")
+    assert ctx.succeeded
+    assert [m.messageType for m in builder.messages] == [MessageType.DevInfo]
+
+
 def test_serialization_round_trip(builder):
     builder.addMessage("Serialize", Severity.WARNING, MessageType.ExcelParsing)
     built = builder.build()
@@ -1,11 +1,19 @@
+from contextlib import closing
+from io import BytesIO
 from typing import Generator
 
 import pytest
 from openpyxl import Workbook
+from openpyxl.workbook.defined_name import DefinedName
 from openpyxl.worksheet.cell_range import CellRange
 from openpyxl.worksheet.worksheet import Worksheet
 
-from mireport.excelutil import CellRangeDimensions, getEffectiveCellRangeDimensions
+from mireport.excelutil import (
+    CellRangeDimensions,
+    getEffectiveCellRangeDimensions,
+    getNamedRanges,
+    loadExcelFromPathOrFileLike,
+)
 
 
 @pytest.fixture
@@ -60,3 +68,23 @@ def test_single_cell_range(sample_worksheet: Worksheet) -> None:
     assert dims.countPopulated == 1
     assert dims.width == 1
     assert dims.height == 1
+
+
+def test_named_ranges_read_only(sample_worksheet: Worksheet) -> None:
+    wb = sample_worksheet.parent
+    sample_worksheet.title = "Data"
+    wb.defined_names["single"] = DefinedName("single", attr_text="Data!$B$3")
+    wb.defined_names["block"] = DefinedName("block", attr_text="Data!$A$1:$B$2")
+    wb.defined_names["beyond"] = DefinedName("beyond", attr_text="Data!$B$3:$B$5")
+    buffer = BytesIO()
+    wb.save(buffer)
+    buffer.seek(0)
+
+    with closing(loadExcelFromPathOrFileLike(buffer, readOnly=True)) as ro:
+        ranges = getNamedRanges(ro)
+
+    assert ranges == {
+        "single": ["Data2"],
+        "block": ["Header1", "Header2", "Data1", None],
+        "beyond": ["Data2", None, None],
+    }
@@ -1,4 +1,15 @@
-from mireport.filesupport import is_valid_filename, zipSafeString
+import os
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from mireport.filesupport import (
+    FilePathAndFileName,
+    copyFileLike,
+    is_valid_filename,
+    zipSafeString,
+)
 
 
 def test_is_valid_filename_valid_cases() -> None:
@@ -56,3 +67,55 @@ def test_zipSafeString_empty_input() -> None:
 
 def test_zipSafeString_custom_fallback() -> None:
     assert zipSafeString("CON", fallback="default") == "default"
+
+
+def test_copyFileLike_from_memory() -> None:
+    source = BytesIO(b"0123456789")
+    source.seek(3)
+    target = BytesIO()
+    copyFileLike(source, target)
+    assert target.getvalue() == b"3456789"
+
+
+def test_copyFileLike_between_files(tmp_path: Path) -> None:
+    content = bytes(range(256)) * 10_000
+    src = tmp_path / "src.bin"
+    dst = tmp_path / "dst.bin"
+    src.write_bytes(content)
+    with open(src, "rb") as source, open(dst, "wb") as target:
+        copyFileLike(source, target)
+    assert dst.read_bytes() == content
+
+
+@pytest.mark.skipif(not hasattr(os, "sendfile"), reason="needs os.sendfile")
+def test_copyFileLike_sendfile_fails_part_way(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    content = bytes(range(256)) * 10_000
+    src = tmp_path / "src.bin"
+    dst = tmp_path / "dst.bin"
+    src.write_bytes(content)
+    realSendfile = os.sendfile
+    calls = 0
+
+    def flakySendfile(outFd: int, inFd: int, offset: int, count: int) -> int:
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            raise OSError("sendfile gave up")
+        return realSendfile(outFd, inFd, offset, min(count, 1000))
+
+    monkeypatch.setattr(os, "sendfile", flakySendfile)
+    with open(src, "rb") as source, open(dst, "wb") as target:
+        copyFileLike(source, target)
+    assert calls == 2
+    assert dst.read_bytes() == content
+
+
+def test_FilePathAndFileName_reads_lazily(tmp_path: Path) -> None:
+    path = tmp_path / "report.zip"
+    source = FilePathAndFileName(path=path, filename=path.name)
+    path.write_bytes(b"written after construction")
+    with source.fileLike() as f:
+        assert f.read() == b"written after construction"
+    assert f.closed
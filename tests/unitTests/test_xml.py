@@ -57,6 +57,25 @@ def test_qname_fromString(qmaker: QNameMaker) -> None:
     qmaker.fromString("utr:badger")
 
 
+def test_qnames_are_canonical(qmaker: QNameMaker) -> None:
+    a = qmaker.fromString("xbrli:monetaryItemType")
+    b = qmaker.fromNamespaceAndLocalName(
+        "http://www.xbrl.org/2003/instance", "monetaryItemType"
+    )
+    assert a is b
+    assert a is qmaker.fromString("xbrli:monetaryItemType")
+
+
+def test_frozen_cache_does_not_grow(qmaker: QNameMaker) -> None:
+    a = qmaker.fromString("xbrli:pure")
+    qmaker.freezeCache()
+    assert a is qmaker.fromString("xbrli:pure")
+    size = len(qmaker._canonical)
+    b = qmaker.fromString("utr:badger")
+    assert b == qmaker.fromString("utr:badger")
+    assert len(qmaker._canonical) == size
+
+
 def test_add_namespace(xbrli_and_utr: NamespaceManager) -> None:
     p = NamespaceManager()
     ns = "http://example.com"